@@ -1,16 +1,16 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
 import logging
 from collections import Counter
 from pathlib import Path
 
 import click
 import yaml
-from rich.console import Console
-from snaphelpers import Snap
 
 from sunbeam.clusterd.service import ManifestItemNotFoundException
+from sunbeam.core import runtime
 from sunbeam.core.checks import JujuLoginCheck, run_preflight_checks
 from sunbeam.core.common import (
     PromptMode,
@@ -21,7 +21,6 @@ from sunbeam.core.common import (
     run_plan,
 )
 from sunbeam.core.deployment import Deployment
-from sunbeam.core.juju import JujuHelper
 from sunbeam.core.manifest import AddManifestStep
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformInitStep
@@ -39,7 +38,7 @@ from sunbeam.steps.vault import VaultCharmUpgradeStep
 from sunbeam.utils import click_option_show_hints
 
 LOG = logging.getLogger(__name__)
-console = Console()
+console = runtime.console()
 _KNOWN_RISKS = {r.value for r in RiskLevel}
 
 
@@ -130,6 +129,15 @@ def refresh(
     deployment: Deployment = ctx.obj
     client = deployment.get_client()
 
+    # When the stored manifest will be used as-is, fetch it from the cluster
+    # database in the background while the Juju login check runs; the two are
+    # independent I/O-bound steps.
+    executor = None
+    manifest_future = None
+    if not manifest_path and not clear_manifest:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        manifest_future = executor.submit(deployment.get_manifest)
+
     # Login to the Juju controller
     run_preflight_checks([JujuLoginCheck(deployment.juju_account)], console)
 
@@ -142,7 +150,7 @@ def refresh(
         # extra charm overrides without changing their channel risk.
         snap_channel_changed = False
         try:
-            current_risk = str(infer_risk(Snap()))
+            current_risk = str(infer_risk(runtime.snap()))
             stored_risk = _stored_manifest_risk(client)
             if stored_risk is not None and stored_risk != current_risk:
                 snap_channel_changed = True
@@ -166,16 +174,22 @@ def refresh(
     manifest = None
     if clear_manifest:
         run_plan([AddManifestStep(client, clear=True)], console, show_hints)
+        deployment.invalidate_manifest_cache()
     elif manifest_path:
         manifest = deployment.get_manifest(manifest_path)
         run_plan([AddManifestStep(client, manifest_path)], console, show_hints)
 
     if not manifest:
         LOG.debug("Getting latest manifest from cluster db")
-        manifest = deployment.get_manifest()
+        if manifest_future is not None:
+            manifest = manifest_future.result()
+        else:
+            manifest = deployment.get_manifest()
+    if executor is not None:
+        executor.shutdown(wait=False)
 
     LOG.debug("Manifest used for deployment - core: %s", manifest.core)
-    jhelper = JujuHelper(deployment.juju_controller)
+    jhelper = deployment.get_juju_helper()
 
     upgrade_coordinator: UpgradeCoordinator
     if upgrade_release:
@@ -258,7 +272,7 @@ def refresh_mysql(
             default=False,
         )
 
-    jhelper = JujuHelper(deployment.juju_controller)
+    jhelper = deployment.get_juju_helper()
 
     upgrade_coordinator = MySQLInChannelUpgradeCoordinator(
         deployment, client, jhelper, manifest, reset_mysql_upgrade_state
@@ -289,7 +303,7 @@ def refresh_vault(
     # Login to the Juju controller
     run_preflight_checks([JujuLoginCheck(deployment.juju_account)], console)
 
-    jhelper = JujuHelper(deployment.juju_controller)
+    jhelper = deployment.get_juju_helper()
 
     manifest = None
     if manifest_path:
@@ -353,7 +367,7 @@ def refresh_k8s(
     """
     deployment: Deployment = ctx.obj
     client = deployment.get_client()
-    jhelper = JujuHelper(deployment.juju_controller)
+    jhelper = deployment.get_juju_helper()
 
     manifest = None
     if manifest_path:
@@ -1,17 +1,17 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import concurrent.futures
 import logging
 
 import click
 from click.core import ParameterSource
-from rich.console import Console
 
 from sunbeam.clusterd.client import Client
+from sunbeam.core import runtime
 from sunbeam.core.checks import JujuLoginCheck, run_preflight_checks
 from sunbeam.core.common import click_option_topology, run_plan
 from sunbeam.core.deployment import Deployment
-from sunbeam.core.juju import JujuHelper
 from sunbeam.core.terraform import TerraformInitStep
 from sunbeam.steps.cinder_volume import DeployCinderVolumeApplicationStep
 from sunbeam.steps.microceph import (
@@ -22,7 +22,7 @@ from sunbeam.steps.openstack import DeployControlPlaneStep
 from sunbeam.utils import click_option_show_hints
 
 LOG = logging.getLogger(__name__)
-console = Console()
+console = runtime.console()
 
 
 @click.command()
@@ -44,10 +44,16 @@ def resize(
     """Expand the control plane to fit available nodes."""
     deployment: Deployment = ctx.obj
     client: Client = deployment.get_client()
-    manifest = deployment.get_manifest()
 
-    # Login to the Juju controller
-    run_preflight_checks([JujuLoginCheck(deployment.juju_account)], console)
+    # Fetch the manifest from the cluster database in the background while
+    # the Juju login check runs; the two are independent I/O-bound steps.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        manifest_future = executor.submit(deployment.get_manifest)
+
+        # Login to the Juju controller
+        run_preflight_checks([JujuLoginCheck(deployment.juju_account)], console)
+
+        manifest = manifest_future.result()
 
     openstack_tfhelper = deployment.get_tfhelper("openstack-plan")
     microceph_tfhelper = deployment.get_tfhelper("microceph-plan")
@@ -59,7 +65,7 @@ def resize(
     if parameter_source == ParameterSource.COMMANDLINE:
         LOG.warning("Option --force is deprecated and the value is ignored")
 
-    jhelper = JujuHelper(deployment.juju_controller)
+    jhelper = deployment.get_juju_helper()
 
     plan: list = []
     if len(storage_nodes):
@@ -74,6 +80,7 @@ def resize(
                     jhelper,
                     manifest,
                     deployment.openstack_machines_model,
+                    skip_apply_if_unchanged=True,
                 ),
                 SetCephMgrPoolSizeStep(
                     client,
@@ -110,6 +117,7 @@ def resize(
                     jhelper,
                     manifest,
                     deployment.openstack_machines_model,
+                    skip_apply_if_unchanged=True,
                 ),
             ]
         )
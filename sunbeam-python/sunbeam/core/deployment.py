@@ -35,6 +35,7 @@ from sunbeam.core.manifest import (
     StorageInstanceManifest,
     StorageManifest,
     embedded_manifest_path,
+    load_manifest_data,
 )
 from sunbeam.core.openstack import REGION_CONFIG_KEY
 from sunbeam.core.proxy import patch_process_env, should_bypass
@@ -109,8 +110,11 @@ class Deployment(pydantic.BaseModel):
     clusterd_certpair: CertPair | None = None
     primary_region_name: str | None = None
     region_name: str | None = None
-    _manifest: Manifest | None = pydantic.PrivateAttr(default=None)
+    _manifest_cache: dict[pathlib.Path | None, Manifest] = pydantic.PrivateAttr(
+        default={}
+    )
     _tfhelpers: dict[str, TerraformHelper] = pydantic.PrivateAttr(default={})
+    _juju_helpers: dict[bool, JujuHelper] = pydantic.PrivateAttr(default={})
     _feature_manager: FeatureManager | None = pydantic.PrivateAttr(default=None)
     _storage_manager: StorageBackendManager | None = pydantic.PrivateAttr(default=None)
 
@@ -342,9 +346,15 @@ class Deployment(pydantic.BaseModel):
         return manifest
 
     def get_manifest(self, manifest_file: pathlib.Path | None = None) -> Manifest:
-        """Return the manifest for the deployment."""
-        if self._manifest is not None:
-            return self._manifest
+        """Return the manifest for the deployment.
+
+        The parsed manifest is cached per manifest file (or per clusterd
+        load when no file is given), so repeated calls within a single CLI
+        invocation skip the cluster DB round-trip and YAML/pydantic parse.
+        """
+        if (manifest := self._manifest_cache.get(manifest_file)) is not None:
+            return manifest
+        cache_key = manifest_file
 
         feature_manager = self.get_feature_manager()
         manifest = Manifest(features=feature_manager.get_all_feature_manifests())
@@ -358,7 +368,7 @@ class Deployment(pydantic.BaseModel):
             try:
                 client = self.get_client()
                 override_manifest = self.parse_manifest(
-                    yaml.safe_load(client.cluster.get_latest_manifest()["data"])
+                    load_manifest_data(client.cluster.get_latest_manifest()["data"])
                 )
                 LOG.debug("Manifest loaded from clusterd")
             except ClusterServiceUnavailableException:
@@ -392,9 +402,13 @@ class Deployment(pydantic.BaseModel):
             override_manifest.validate_against_default(manifest)
             manifest = manifest.merge(override_manifest)
 
-        self._manifest = manifest
+        self._manifest_cache[cache_key] = manifest
         return manifest
 
+    def invalidate_manifest_cache(self) -> None:
+        """Drop cached manifests, forcing the next get_manifest to reload."""
+        self._manifest_cache.clear()
+
     def _get_juju_clusterd_env(self) -> dict:
         env = {}
         if self.juju_controller and self.juju_account:
@@ -483,11 +497,19 @@ class Deployment(pydantic.BaseModel):
 
         If the "keystone" flag is set and this is a secondary region
         of a multi-region environment, the region controller will be used.
+
+        Helpers are cached per controller so steps within one CLI
+        invocation share a single JujuHelper.
         """
-        if keystone and self.region_ctrl_juju_controller:
-            return JujuHelper(self.region_ctrl_juju_controller)
+        use_region_ctrl = bool(keystone and self.region_ctrl_juju_controller)
+        if (jhelper := self._juju_helpers.get(use_region_ctrl)) is not None:
+            return jhelper
+        if use_region_ctrl:
+            jhelper = JujuHelper(self.region_ctrl_juju_controller)
         else:
-            return JujuHelper(self.juju_controller)
+            jhelper = JujuHelper(self.juju_controller)
+        self._juju_helpers[use_region_ctrl] = jhelper
+        return jhelper
 
     def get_space(self, network: Networks) -> str:
         """Get space associated to network."""
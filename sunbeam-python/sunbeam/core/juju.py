@@ -44,9 +44,18 @@ OWNER_TAG_PREFIX = "user-"
 
 MODEL_DELAY = 10
 
+# Charmhub channel risks, ordered from most to least stable
+_CHANNEL_RISKS = ("stable", "candidate", "beta", "edge")
+
 T = TypeVar("T")
 
 
+@functools.lru_cache(maxsize=1)
+def _juju_binary() -> str:
+    """Return the juju binary path, invariant for the process lifetime."""
+    return str(Snap().paths.snap / "juju" / "bin" / "juju")
+
+
 class JujuException(SunbeamException):
     """Main juju exception, to be subclassed."""
 
@@ -257,6 +266,10 @@ class JujuHelper:
             raise ValueError("Controller cannot be None")
         self.controller: str = controller.name
         self._juju = jubilant.Juju()
+        # Charmhub revision listings keyed on (charm, channel, base); an
+        # upgrade pass queries the same pair for every app sharing a charm
+        # (e.g. the mysql routers) and each lookup is a `juju info` call.
+        self._charm_revisions_cache: dict[tuple[str, str, str], dict[str, int]] = {}
 
     def cli(
         self,
@@ -668,16 +681,23 @@ class JujuHelper:
             )
         return new_units
 
-    def remove_unit(self, name: str, unit: str, model: str):
-        """Remove unit from application.
+    def remove_unit(self, name: str, unit: str | list[str], model: str):
+        """Remove unit(s) from application.
+
+        Removing several units at once issues a single Juju call instead
+        of one round-trip per unit.
 
         :name: Application name
-        :unit: Unit tag
+        :unit: Unit tag or list of unit tags
         :model: Name of the model where the application is located
         """
-        self._validate_unit(unit)
+        units = [unit] if isinstance(unit, str) else unit
+        if not units:
+            raise ValueError("Unit cannot be empty")
+        for u in units:
+            self._validate_unit(u)
         with self._model(model) as juju:
-            juju.remove_unit(unit)
+            juju.remove_unit(*units)
 
     def show_unit(self, model: str, unit_name: str) -> dict:
         """Show information about a unit.
@@ -1325,10 +1345,11 @@ class JujuHelper:
         ) -> bool:
             """Check if units are gone."""
             for app, units in app_units.items():
-                if app not in status.apps:
+                app_status = status.apps.get(app)
+                if app_status is None:
                     continue
                 name_set = set(units)
-                if len(name_set.intersection(status.apps[app].units)) > 0:
+                if len(name_set.intersection(app_status.units)) > 0:
                     return False
             return True
 
@@ -1677,11 +1698,18 @@ class JujuHelper:
         When no architectures are listed for an entry, the key ``"all"`` is
         used as a fallback.
 
+        Results are memoized per (charm, channel, base) for the lifetime of
+        this helper, so walking all apps in a status only queries Charmhub
+        once per distinct charm.
+
         :param charm_name: Name of charm to look up
         :param channel: Channel to lookup charm in
         :param base: Base to lookup charm in, default is JUJU_BASE
         :raises JujuException: if the channel/base combination is not found
         """
+        cache_key = (charm_name, channel, base)
+        if (cached := self._charm_revisions_cache.get(cache_key)) is not None:
+            return dict(cached)
         parts = channel.split("/")
         if len(parts) < 2:
             raise JujuException(
@@ -1721,6 +1749,7 @@ class JujuHelper:
                 f"Could not find charm {charm_name!r} in channel {channel!r} "
                 f"with base {base!r}"
             )
+        self._charm_revisions_cache[cache_key] = dict(revisions)
         return revisions
 
     def get_charm_channel_for_revision(
@@ -1949,9 +1978,7 @@ class JujuStepHelper:
 
     def _get_juju_binary(self) -> str:
         """Get juju binary path."""
-        snap = Snap()
-        juju_binary = snap.paths.snap / "juju" / "bin" / "juju"
-        return str(juju_binary)
+        return _juju_binary()
 
     def _juju_cmd(self, *args, json_format=True, env=None, cwd=None, timeout=None):
         """Runs the specified juju command line command.
@@ -2206,31 +2233,40 @@ class JujuStepHelper:
             if charm in charms
         ]
 
-    def normalise_channel(self, channel: str) -> str:
+    @staticmethod
+    def normalise_channel(channel: str) -> str:
         """Expand channel if it is using abbreviation.
 
         Juju supports abbreviating latest/{risk} to {risk}. This expands it.
 
         :param channel: Channel string to normalise
         """
-        if channel in ["stable", "candidate", "beta", "edge"]:
+        if channel in _CHANNEL_RISKS:
             channel = f"latest/{channel}"
         return channel
 
-    def channel_update_needed(self, channel: str, new_channel: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def channel_update_needed(channel: str, new_channel: str) -> bool:
         """Compare two channels and see if the second is 'newer'.
 
+        Called once per application when walking a model status, so the
+        outcome is memoized per channel pair.
+
         :param current_channel: Current channel
         :param new_channel: Proposed new channel
         """
-        risks = ["stable", "candidate", "beta", "edge"]
-        current_channel = self.normalise_channel(channel)
+        # Steady state: almost every app is already on the target channel
+        if channel == new_channel:
+            return False
+        risks = _CHANNEL_RISKS
+        current_channel = JujuStepHelper.normalise_channel(channel)
         current_parts = current_channel.split("/")
         if len(current_parts) < 2:
             LOG.error("Invalid channel format %r", channel)
             return False
         current_track, current_risk = current_parts[0], current_parts[1]
-        new_channel = self.normalise_channel(new_channel)
+        new_channel = JujuStepHelper.normalise_channel(new_channel)
         new_parts = new_channel.split("/")
         if len(new_parts) < 2:
             LOG.error("Invalid channel format %r", new_channel)
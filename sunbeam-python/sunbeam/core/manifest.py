@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import hashlib
+import json
 import logging
 import typing
 from pathlib import Path
@@ -40,6 +42,35 @@ def embedded_manifest_path(snap: Snap, version: str, risk: str) -> Path:
     return snap.paths.snap / "etc" / "manifests" / version / f"{risk}.yml"
 
 
+def load_manifest_data(raw: str) -> dict:
+    """Parse a raw manifest payload, memoizing the result on disk.
+
+    The manifest stored in clusterd changes rarely but is re-parsed on
+    every CLI invocation. Keep the parsed document as JSON next to the
+    snap user data, keyed by a digest of the raw payload, so repeat
+    invocations decode JSON instead of re-running the YAML parser. The
+    cache self-invalidates when the payload changes and any read or
+    write failure simply falls back to parsing the YAML.
+    """
+    digest = hashlib.blake2b(raw.encode("utf-8")).hexdigest()
+    cache_file = None
+    try:
+        cache_file = Snap().paths.user_common / "manifest.cache"
+        cached = json.loads(cache_file.read_text("utf-8"))
+        if cached.get("digest") == digest:
+            return cached["data"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    data = yaml.safe_load(raw) or {}
+    if cache_file is not None:
+        try:
+            cache_file.write_text(json.dumps({"digest": digest, "data": data}), "utf-8")
+        except (OSError, TypeError):
+            LOG.debug("Failed to write manifest cache", exc_info=True)
+    return data
+
+
 class JujuManifest(pydantic.BaseModel):
     # Setting Field alias not supported in pydantic 1.10.0
     # Old version of pydantic is used due to dependencies
@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: 2026 - Canonical Ltd
+# SPDX-License-Identifier: Apache-2.0
+
+"""Process-wide lazily constructed singletons.
+
+Snap() touches the filesystem and environment and Console() probes
+terminal capabilities; modules should not pay that cost at import time,
+nor should every module allocate its own Console with its own IO lock.
+"""
+
+import functools
+
+from rich.console import Console
+from snaphelpers import Snap
+
+
+@functools.lru_cache(maxsize=1)
+def snap() -> Snap:
+    """Return the process-wide Snap instance."""
+    return Snap()
+
+
+@functools.lru_cache(maxsize=1)
+def console() -> Console:
+    """Return the process-wide rich Console."""
+    return Console()
@@ -73,6 +73,7 @@ class DeployMachineApplicationStep(BaseStep):
         banner: str = "",
         description: str = "",
         wait_for_readiness: bool = True,
+        skip_apply_if_unchanged: bool = False,
     ):
         super().__init__(banner, description)
         self.deployment = deployment
@@ -85,6 +86,8 @@ class DeployMachineApplicationStep(BaseStep):
         self.model = model
         self.roles = roles or []
         self.wait_for_readiness = wait_for_readiness
+        self.skip_apply_if_unchanged = skip_apply_if_unchanged
+        self._machine_ids: list[str] | None = None
 
     def extra_tfvars(self) -> dict:
         """Extra terraform vars to pass to terraform apply."""
@@ -103,7 +106,7 @@ class DeployMachineApplicationStep(BaseStep):
         return ["active", "unknown"]
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=convert_retry_failure_as_result,
@@ -117,24 +120,29 @@ class DeployMachineApplicationStep(BaseStep):
             extra_tfvars["machine_model_uuid"] = self.jhelper.get_model_uuid(self.model)
 
             if "machine_ids" not in extra_tfvars:
-                machine_ids: set[str] = set()
-                nodes: list[dict] = []
-
-                for role in self.roles:
-                    if isinstance(role, Role):
-                        role = [role]
-                    nodes = self.client.cluster.list_nodes_by_role(
-                        roles_to_str_list(role)
-                    )
-                    machine_ids.update(
-                        {
-                            node["machineid"]
-                            for node in nodes
-                            if node.get("machineid", -1) != -1
-                        }
-                    )
-
-                extra_tfvars["machine_ids"] = sorted(machine_ids)
+                # Compute once and reuse so retries on a locked terraform
+                # state do not re-query clusterd for every role
+                if self._machine_ids is None:
+                    machine_ids: set[str] = set()
+                    nodes: list[dict] = []
+
+                    for role in self.roles:
+                        if isinstance(role, Role):
+                            role = [role]
+                        nodes = self.client.cluster.list_nodes_by_role(
+                            roles_to_str_list(role)
+                        )
+                        machine_ids.update(
+                            {
+                                node["machineid"]
+                                for node in nodes
+                                if node.get("machineid", -1) != -1
+                            }
+                        )
+
+                    self._machine_ids = sorted(machine_ids)
+
+                extra_tfvars["machine_ids"] = self._machine_ids
 
             self.tfhelper.update_tfvars_and_apply_tf(
                 self.client,
@@ -143,6 +151,7 @@ class DeployMachineApplicationStep(BaseStep):
                 override_tfvars=extra_tfvars,
                 tf_apply_extra_args=self.tf_apply_extra_args(),
                 reporter=context.reporter,
+                skip_apply_if_unchanged=self.skip_apply_if_unchanged,
             )
         except TerraformException as e:
             return Result(ResultType.FAILED, str(e))
@@ -179,6 +188,7 @@ class RemoveMachineUnitsStep(BaseStep):
         model: str,
         banner: str = "",
         description: str = "",
+        nodes: list[dict] | None = None,
     ):
         super().__init__(banner, description)
         self.client = client
@@ -192,6 +202,10 @@ class RemoveMachineUnitsStep(BaseStep):
         self.machine_id = ""
         self.unit = None
         self.units_to_remove = set()
+        # Optional preloaded node list; when a plan queues several unit
+        # removal steps the caller can list the cluster nodes once and
+        # share the result instead of one clusterd query per step.
+        self.nodes = nodes
 
     def get_unit_timeout(self) -> int:
         """Return unit timeout in seconds."""
@@ -205,7 +219,9 @@ class RemoveMachineUnitsStep(BaseStep):
         """
         if len(self.names) == 0:
             return Result(ResultType.SKIPPED)
-        nodes: list[dict] = self.client.cluster.list_nodes()
+        nodes: list[dict] = (
+            self.nodes if self.nodes is not None else self.client.cluster.list_nodes()
+        )
 
         filtered_nodes = list(filter(lambda node: node["name"] in self.names, nodes))
         if len(filtered_nodes) != len(self.names):
@@ -240,11 +256,10 @@ class RemoveMachineUnitsStep(BaseStep):
         """Remove unit from machine application on Juju model."""
         try:
             self.update_status(context, "Removing units")
-            for unit in self.units_to_remove:
-                LOG.debug(
-                    "Removing unit %s from application %s", unit, self.application
-                )
-                self.jhelper.remove_unit(self.application, unit, self.model)
+            units = sorted(self.units_to_remove)
+            LOG.debug("Removing units %s from application %s", units, self.application)
+            # One Juju call for all units rather than one round-trip per unit
+            self.jhelper.remove_unit(self.application, units, self.model)
             self.update_status(context, "Waiting for units to be removed")
             self.jhelper.wait_units_gone(
                 list(self.units_to_remove), self.model, self.get_unit_timeout()
@@ -333,7 +348,7 @@ class DestroyMachineApplicationStep(BaseStep):
         return Result(ResultType.COMPLETED)
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=convert_retry_failure_as_result,
@@ -419,6 +419,7 @@ class TerraformHelper:
         override_tfvars: dict | None = None,
         tf_apply_extra_args: list | None = None,
         reporter: ProgressReporter | None = None,
+        skip_apply_if_unchanged: bool = False,
     ) -> None:
         """Updates terraform vars and Apply the terraform.
 
@@ -433,6 +434,9 @@ class TerraformHelper:
         :param tfvar_config: TerraformVar key name used to save tfvar in clusterdb
         :param override_tfvars: Terraform vars to override (computed/runtime)
         :param tf_apply_extra_args: Extra args to terraform apply command
+        :param skip_apply_if_unchanged: Skip the terraform apply when the
+            merged tfvars are identical to the ones stored in clusterdb,
+            i.e. the previous apply of this plan already converged on them
         """
         # Step 1: Load and filter DB values
         computed_keys, updated_tfvars = self._load_and_filter_db_tfvars(
@@ -453,6 +457,18 @@ class TerraformHelper:
             self._apply_tfvars(updated_tfvars, override_tfvars)
 
         # Step 4: Save and apply
+        if (
+            skip_apply_if_unchanged
+            and tfvar_config
+            and not tf_apply_extra_args
+            and self._stored_tfvars_match(
+                client, tfvar_config, updated_tfvars, computed_keys
+            )
+        ):
+            LOG.debug("Plan %s: tfvars unchanged, skipping terraform apply", self.plan)
+            self.write_tfvars(updated_tfvars)
+            return
+
         if tfvar_config:
             data_to_save = dict(updated_tfvars)
             data_to_save["_computed_keys"] = list(computed_keys)
@@ -498,6 +514,18 @@ class TerraformHelper:
 
         return computed_keys, updated_tfvars
 
+    def _stored_tfvars_match(
+        self, client: Client, tfvar_config: str, tfvars: dict, computed_keys: set
+    ) -> bool:
+        """Whether the stored tfvar config already matches the merged tfvars."""
+        try:
+            stored = read_config(client, tfvar_config)
+        except ConfigItemNotFoundException:
+            return False
+        stored_computed = set(stored.get("_computed_keys", []))
+        stored_tfvars = {k: v for k, v in stored.items() if k != "_computed_keys"}
+        return stored_tfvars == tfvars and stored_computed == computed_keys
+
     def _apply_tfvars(self, target: dict, source: dict) -> None:
         """Apply source tfvars to target with charm config merging.
 
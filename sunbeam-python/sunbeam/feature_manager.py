@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import importlib
+import json
 import logging
 import pathlib
 import typing
@@ -23,6 +24,7 @@ from sunbeam.core.common import (
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.manifest import FeatureGroupManifest, FeatureManifest
 from sunbeam.feature_gates import FEATURE_GATES, FeatureGateMixin, log_gated_feature
+from sunbeam.features.interface import utils as feature_utils
 from sunbeam.features.interface.v1.base import (
     BaseFeature,
     BaseFeatureGroup,
@@ -383,8 +385,18 @@ class FeatureManager:
         LOG.debug("Registering features")
         snap = Snap()
 
+        # Walk the cli group tree once and share the resulting map with every
+        # registration; newly created groups are added to it incrementally.
+        groups = feature_utils.get_all_registered_groups(cli)
+
+        # Command validation only depends on the feature version, so keep a
+        # small on-disk table of already validated versions and skip the
+        # validation walk for features that have not changed since.
+        validated_versions = self._load_validated_versions(snap)
+        validated_versions_dirty = False
+
         for group in self.groups().values():
-            group.register(cli)
+            group.register(cli, groups=groups)
 
         for feature in self.features().values():
             # Check 1: Feature gates - skip if feature is gated
@@ -423,8 +435,18 @@ class FeatureManager:
                     "Feature %r failed to check if it is enabled: %r", feature.name, e
                 )
                 enabled = False
+            version = str(feature.version)
+            skip_validation = validated_versions.get(feature.name) == version
             try:
-                feature.register(cli, {"enabled": enabled})
+                registered = feature.register(
+                    cli,
+                    {"enabled": enabled},
+                    groups=groups,
+                    skip_validation=skip_validation,
+                )
+                if registered and not skip_validation:
+                    validated_versions[feature.name] = version
+                    validated_versions_dirty = True
             except (ValueError, SunbeamException) as e:
                 LOG.debug("Failed to register feature: %r", str(feature))
                 if "Clusterd address" in str(e) or "Insufficient permissions" in str(e):
@@ -434,6 +456,31 @@ class FeatureManager:
                     continue
                 raise e
 
+        if validated_versions_dirty:
+            self._save_validated_versions(snap, validated_versions)
+
+    def _validated_versions_path(self, snap: Snap) -> pathlib.Path:
+        return snap.paths.user_common / "feature_validated_versions.json"
+
+    def _load_validated_versions(self, snap: Snap) -> dict[str, str]:
+        """Load the feature name to validated version table from disk."""
+        try:
+            content = json.loads(self._validated_versions_path(snap).read_text())
+        except (OSError, TypeError, json.JSONDecodeError):
+            return {}
+        if not isinstance(content, dict):
+            return {}
+        return content
+
+    def _save_validated_versions(self, snap: Snap, versions: dict[str, str]) -> None:
+        """Persist the feature name to validated version table to disk."""
+        try:
+            path = self._validated_versions_path(snap)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(versions))
+        except (OSError, TypeError):
+            LOG.debug("Failed to save validated feature versions", exc_info=True)
+
     def resolve_feature(self, feature: str) -> BaseFeature | None:
         """Resolve a feature name to a class.
 
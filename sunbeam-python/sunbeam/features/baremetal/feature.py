@@ -5,7 +5,6 @@ import logging
 import typing
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.checks import JujuLoginCheck, run_preflight_checks
@@ -29,6 +28,7 @@ from sunbeam.features.baremetal import constants, feature_config, steps
 from sunbeam.features.baremetal.feature_config import (
     BaremetalFeatureConfig,
 )
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     EnableOpenStackApplicationStep,
     OpenStackControlPlaneFeature,
@@ -42,7 +42,7 @@ console = Console()
 
 
 class BaremetalFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "baremetal"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import logging
 import subprocess
 import tempfile
@@ -11,11 +12,11 @@ import click
 import httpx
 import yaml
 from packaging.version import Version
-from rich.console import Console
 from snaphelpers import Snap
 
 from sunbeam.clusterd.client import Client
 from sunbeam.clusterd.service import ConfigItemNotFoundException
+from sunbeam.core import runtime
 from sunbeam.core.common import (
     BaseStep,
     Result,
@@ -36,7 +37,11 @@ from sunbeam.core.manifest import (
 )
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformInitStep
-from sunbeam.features.interface.v1.base import ConfigType, FeatureRequirement
+from sunbeam.features.interface.v1.base import (
+    ConfigType,
+    FeatureRequirement,
+    LazyVersion,
+)
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -69,7 +74,7 @@ else:
 
 
 LOG = logging.getLogger(__name__)
-console = Console()
+console = runtime.console()
 
 PROVIDER_WAIT_TIMEOUT = 300  # 5 minutes for each provider
 KUBECONFIG_SECRET_NAME = "kubeconfig"
@@ -645,35 +650,46 @@ class DeleteClusterAPI(BaseStep):
 
 
 class CaasFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
-    requires = {
-        FeatureRequirement("secrets"),
-        FeatureRequirement("loadbalancer"),
-    }
+    version = LazyVersion("0.0.1")
+    requires = frozenset(
+        {
+            FeatureRequirement("secrets"),
+            FeatureRequirement("loadbalancer"),
+        }
+    )
 
     name = "caas"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
     kubeconfig_secret: str | None = None
 
+    _software_overrides: SoftwareConfig | None = None
+    _tfvar_map: dict | None = None
+
     def default_software_overrides(self) -> SoftwareConfig:
         """Feature software configuration."""
-        return SoftwareConfig(
-            charms={"magnum-k8s": CharmManifest(channel=OPENSTACK_CHANNEL)},
-        )
+        if self._software_overrides is None:
+            self._software_overrides = SoftwareConfig(
+                charms={"magnum-k8s": CharmManifest(channel=OPENSTACK_CHANNEL)},
+            )
+        return self._software_overrides
 
     def manifest_attributes_tfvar_map(self) -> dict:
         """Manifest attributes terraformvars map."""
-        return {
-            self.tfplan: {
-                "charms": {
-                    "magnum-k8s": {
-                        "channel": "magnum-channel",
-                        "revision": "magnum-revision",
-                        "config": "magnum-config",
+        if self._tfvar_map is None:
+            self._tfvar_map = {
+                self.tfplan: {
+                    "charms": {
+                        "magnum-k8s": {
+                            "channel": "magnum-channel",
+                            "revision": "magnum-revision",
+                            "config": "magnum-config",
+                        }
                     }
-                }
-            },
-        }
+                },
+            }
+        # Deep copy: FeatureManager merges these maps in place, which would
+        # otherwise corrupt the cache for sibling openstack-plan features
+        return copy.deepcopy(self._tfvar_map)
 
     def set_application_names(self, deployment: Deployment) -> list:
         """Application names handled by the terraform plan."""
@@ -687,9 +703,9 @@ class CaasFeature(OpenStackControlPlaneFeature):
         self, deployment: Deployment, config: FeatureConfig
     ) -> dict:
         """Set terraform variables to enable the application."""
-        tfvars = {
+        tfvars = self.add_horizon_plugin_to_tfvars(deployment, "magnum")
+        tfvars |= {
             "enable-magnum": True,
-            **self.add_horizon_plugin_to_tfvars(deployment, "magnum"),
         }
 
         if self.kubeconfig_secret:
@@ -699,10 +715,9 @@ class CaasFeature(OpenStackControlPlaneFeature):
 
     def set_tfvars_on_disable(self, deployment: Deployment) -> dict:
         """Set terraform variables to disable the application."""
-        return {
-            "enable-magnum": False,
-            **self.remove_horizon_plugin_from_tfvars(deployment, "magnum"),
-        }
+        tfvars = self.remove_horizon_plugin_from_tfvars(deployment, "magnum")
+        tfvars["enable-magnum"] = False
+        return tfvars
 
     def set_tfvars_on_resize(
         self, deployment: Deployment, config: FeatureConfig
@@ -742,7 +757,7 @@ class CaasFeature(OpenStackControlPlaneFeature):
     ) -> None:
         """Run plans to enable feature."""
         tfhelper = deployment.get_tfhelper(self.tfplan)
-        jhelper = JujuHelper(deployment.juju_controller)
+        jhelper = deployment.get_juju_helper()
         client = deployment.get_client()
         kc_dict = self._get_kubeconfig(client)
         proxy_settings = deployment.get_proxy_settings()
@@ -786,7 +801,7 @@ class CaasFeature(OpenStackControlPlaneFeature):
     def run_disable_plans(self, deployment: Deployment, show_hints: bool) -> None:
         """Run plans to disable the feature."""
         tfhelper = deployment.get_tfhelper(self.tfplan)
-        jhelper = JujuHelper(deployment.juju_controller)
+        jhelper = deployment.get_juju_helper()
         client = deployment.get_client()
 
         plan = [
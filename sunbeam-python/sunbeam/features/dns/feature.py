@@ -7,7 +7,6 @@ import click
 import lightkube.core.exceptions as l_core_exceptions
 import lightkube.resources.core_v1 as l_core_v1
 import pydantic
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import BaseStep, run_plan
@@ -25,7 +24,7 @@ from sunbeam.core.steps import (
     PatchLoadBalancerServicesIPStep,
 )
 from sunbeam.core.terraform import TerraformInitStep
-from sunbeam.features.interface.v1.base import is_maas_deployment
+from sunbeam.features.interface.v1.base import LazyVersion, is_maas_deployment
 from sunbeam.features.interface.v1.openstack import (
     EnableOpenStackApplicationStep,
     OpenStackControlPlaneFeature,
@@ -80,7 +79,7 @@ class PatchBindLoadBalancerIPPoolStep(PatchLoadBalancerServicesIPPoolStep):
 
 
 class DnsFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "dns"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -4,11 +4,11 @@
 import logging
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.manifest import CharmManifest, FeatureConfig, SoftwareConfig
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -21,7 +21,7 @@ console = Console()
 
 
 class ImagesSyncFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "images-sync"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -5,7 +5,6 @@ import logging
 from pathlib import Path
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import BaseStep, run_plan
@@ -20,6 +19,7 @@ from sunbeam.core.manifest import (
 )
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformInitStep
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -38,10 +38,12 @@ from . import consul
 
 console = Console()
 LOG = logging.getLogger(__name__)
+# Computed once at import; the terraform plan sources never move at runtime.
+_ETC_DIR = Path(__file__).resolve().parent / "etc"
 
 
 class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "instance-recovery"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -57,7 +59,7 @@ class InstanceRecoveryFeature(OpenStackControlPlaneFeature):
             },
             terraform={
                 self.tf_plan_consul_client: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / "deploy-consul-client"
+                    source=_ETC_DIR / "deploy-consul-client"
                 ),
             },
         )
@@ -50,8 +50,10 @@ def get_all_registered_groups(cli: click.Group) -> dict:
 
     def _get_all_groups(group):
         groups = {}
-        for cmd in group.list_commands({}):
-            obj = group.get_command({}, cmd)
+        # Iterate over already registered commands directly; going through
+        # list_commands/get_command would force LazyGroup subcommands to be
+        # imported just to discover they are not groups.
+        for cmd, obj in group.commands.items():
             if isinstance(obj, click.Group):
                 # cli group name is init
                 if group.name == "init":
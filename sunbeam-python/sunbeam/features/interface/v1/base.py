@@ -70,9 +70,30 @@ class HasRequirersFeaturesError(FeatureError):
     """Exception raised when feature has requirers features."""
 
 
+class LazyVersion:
+    """Class attribute that parses a PEP 440 version string on first access.
+
+    Feature classes declare their version in the class body; parsing the
+    string eagerly adds up across the dozens of feature modules imported
+    at CLI startup, so defer it until the version is actually read.
+    """
+
+    def __init__(self, version: str):
+        self.raw = version
+        self._parsed: Version | None = None
+
+    def __get__(self, instance: object, owner: type | None = None) -> Version:
+        """Return the parsed version, parsing it on first access."""
+        if self._parsed is None:
+            self._parsed = Version(self.raw)
+        return self._parsed
+
+
 class ClickInstantiator:
     """Support invoking click commands on instance methods."""
 
+    __slots__ = ("command", "registerable")
+
     def __init__(self, command: click.Command, registerable: "BaseRegisterable"):
         self.command = command
         self.registerable = registerable
@@ -97,7 +118,10 @@ class BaseRegisterable(ABC):
 
         :returns: True if validation is successful, else False.
         """
-        self_commands = self.commands(conditions)
+        return self._validate_commands(self.commands(conditions))
+
+    def _validate_commands(self, self_commands: dict[str, list[dict]]) -> bool:
+        """Validate an already-built commands dictionary."""
         LOG.debug("Validating commands: %s", self_commands)
         for group, commands in self_commands.items():
             for command in commands:
@@ -110,12 +134,7 @@ class BaseRegisterable(ABC):
                     )
                     return False
 
-                if not any(
-                    [
-                        isinstance(cmd_func, click.Group),
-                        isinstance(cmd_func, click.Command),
-                    ]
-                ):
+                if not isinstance(cmd_func, (click.Group, click.Command)):
                     LOG.warning(
                         "Feature %s: %s should be either click.Group or click.Command",
                         self.name,
@@ -203,20 +222,34 @@ class BaseRegisterable(ABC):
         """
 
     def register(
-        self, cli: click.Group, conditions: typing.Mapping[str, str | bool] = {}
-    ) -> None:
+        self,
+        cli: click.Group,
+        conditions: typing.Mapping[str, str | bool] = {},
+        groups: dict[str, click.Group] | None = None,
+        skip_validation: bool = False,
+    ) -> bool:
         """Register feature groups and commands.
 
         :param cli: Sunbeam main cli group
+        :param groups: Optional shared map of registered groups, as returned
+            by utils.get_all_registered_groups. When registering many
+            features the caller can compute the map once and pass it in;
+            newly created click groups are added to it so subsequent
+            registrations see them without re-walking the cli tree.
+        :param skip_validation: Skip the commands validation walk, e.g. when
+            the caller knows this feature version was already validated.
+        :returns: False if command validation failed, True otherwise.
         """
         LOG.debug("Registering feature %s", self.name)
-        if not self.validate_commands(conditions):
+        self_commands = self.commands(conditions)
+        if not skip_validation and not self._validate_commands(self_commands):
             LOG.warning("Not able to register the feature %s", self.name)
-            return
+            return False
 
-        groups = utils.get_all_registered_groups(cli)
+        if groups is None:
+            groups = utils.get_all_registered_groups(cli)
         LOG.debug("Registered groups: %s", groups)
-        for group, commands in self.commands(conditions).items():
+        for group, commands in self_commands.items():
             group_obj = groups.get(group)
             if not group_obj:
                 cmd_names = [command.get("name") for command in commands]
@@ -229,6 +262,9 @@ class BaseRegisterable(ABC):
                 )
                 continue
 
+            # Materialize the group's command names once instead of sorting
+            # the full list for every command registered into it.
+            existing_names = set(group_obj.list_commands({}))
             for command in commands:
                 cmd = command.get("command")
                 if not cmd:
@@ -241,7 +277,7 @@ class BaseRegisterable(ABC):
                     )
                     continue
                 cmd_name = command.get("name")
-                if cmd_name in group_obj.list_commands({}):
+                if cmd_name in existing_names:
                     if isinstance(cmd, click.Command):
                         LOG.warning(
                             "Feature %s: Discarding adding command %s as it already"
@@ -262,6 +298,7 @@ class BaseRegisterable(ABC):
 
                 cmd.callback = ClickInstantiator(cmd.callback, self)
                 group_obj.add_command(cmd, cmd_name)
+                existing_names.add(cmd_name)
                 LOG.debug(
                     "Feature %s: Command %s is registered in group %s",
                     self.name,
@@ -275,6 +312,8 @@ class BaseRegisterable(ABC):
                 if isinstance(cmd, click.Group):
                     groups[f"{group}.{cmd_name}"] = cmd
 
+        return True
+
 
 class BaseFeatureGroup(BaseRegisterable):
     """A feature group assumes enable/disable."""
@@ -314,10 +353,10 @@ class BaseFeature(BaseRegisterable, FeatureGateMixin, Generic[ConfigType]):
     """
 
     # Version of feature interface used by Feature
-    interface_version = Version("0.0.1")
+    interface_version = LazyVersion("0.0.1")
 
     # Version of feature
-    version = Version("0.0.0")
+    version = LazyVersion("0.0.0")
 
     # Name of feature
     name: str
@@ -416,16 +455,28 @@ class BaseFeature(BaseRegisterable, FeatureGateMixin, Generic[ConfigType]):
         """
         pass
 
+    # Per-instance cache of feature info keyed by client identity, filled
+    # lazily on first read. Spares a clusterd round-trip every time the
+    # feature info is consulted again within the same CLI invocation.
+    _feature_info_cache: dict[int, dict] | None = None
+
     def get_feature_info(self, client: Client) -> dict:
         """Get feature information from clusterdb.
 
         :returns: Dictionay with feature details like version, and any other information
                   uploded by feature.
         """
+        if self._feature_info_cache is None:
+            self._feature_info_cache = {}
+        cached = self._feature_info_cache.get(id(client))
+        if cached is not None:
+            return dict(cached)
         try:
-            return read_config(client, self.feature_key)
+            info = read_config(client, self.feature_key)
         except ConfigItemNotFoundException:
             return {}
+        self._feature_info_cache[id(client)] = dict(info)
+        return info
 
     def update_feature_info(self, client: Client, info: dict) -> None:
         """Update feature information in clusterdb.
@@ -438,6 +489,8 @@ class BaseFeature(BaseRegisterable, FeatureGateMixin, Generic[ConfigType]):
         info_from_db.update(info)
         info_from_db.update({"version": str(self.version)})
         update_config(client, self.feature_key, info_from_db)
+        if self._feature_info_cache is not None:
+            self._feature_info_cache[id(client)] = dict(info_from_db)
 
     def fetch_feature_version(self, client: Client, feature: str) -> Version:
         """Fetch feature version stored in database.
@@ -584,9 +637,9 @@ class EnableDisableFeature(BaseFeature, Generic[ConfigType]):
     of BaseFeature.
     """
 
-    interface_version = Version("0.0.1")
+    interface_version = LazyVersion("0.0.1")
 
-    requires: set[FeatureRequirement] = set()
+    requires: frozenset[FeatureRequirement] = frozenset()
 
     enable_cmd: click.Command
     disable_cmd: click.Command
@@ -9,7 +9,6 @@ from enum import Enum
 from pathlib import Path
 
 import click
-from packaging.version import Version
 from rich.console import Console
 from snaphelpers import Snap
 
@@ -45,7 +44,11 @@ from sunbeam.core.terraform import (
     TerraformInitStep,
     TerraformStateLockedException,
 )
-from sunbeam.features.interface.v1.base import ConfigType, EnableDisableFeature
+from sunbeam.features.interface.v1.base import (
+    ConfigType,
+    EnableDisableFeature,
+    LazyVersion,
+)
 from sunbeam.steps.openstack import (
     DATABASE_MAX_POOL_SIZE,
     DATABASE_STORAGE_KEY,
@@ -91,7 +94,7 @@ class OpenStackControlPlaneFeature(EnableDisableFeature, typing.Generic[ConfigTy
     """
 
     _manifest: Manifest | None
-    interface_version = Version("0.0.1")
+    interface_version = LazyVersion("0.0.1")
     tf_plan_location: TerraformPlanLocation
 
     def __init__(self) -> None:
@@ -113,6 +116,7 @@ class OpenStackControlPlaneFeature(EnableDisableFeature, typing.Generic[ConfigTy
 
         self.snap = Snap()
         self._manifest = None
+        self._database_topology: str | None = None
 
     @property
     def manifest(self) -> Manifest:
@@ -207,10 +211,13 @@ class OpenStackControlPlaneFeature(EnableDisableFeature, typing.Generic[ConfigTy
 
     def get_database_topology(self, deployment: Deployment) -> str:
         """Returns the database topology of the cluster."""
-        # Database topology can be set only during bootstrap and cannot be changed.
-        client = deployment.get_client()
-        topology = read_config(client, TOPOLOGY_KEY)
-        return topology["database"]
+        # Database topology can be set only during bootstrap and cannot be
+        # changed, so one config lookup per feature instance is enough.
+        if self._database_topology is None:
+            client = deployment.get_client()
+            topology = read_config(client, TOPOLOGY_KEY)
+            self._database_topology = topology["database"]
+        return self._database_topology
 
     def get_cluster_topology(self, deployment: Deployment) -> str:
         """Returns the cluster topology of the cluster."""
@@ -359,13 +366,10 @@ class OpenStackControlPlaneFeature(EnableDisableFeature, typing.Generic[ConfigTy
     def set_tfvars_on_resize(self, deployment: Deployment, config: ConfigType) -> dict:
         """Set terraform variables to resize the application."""
 
-    def add_horizon_plugin_to_tfvars(
-        self, deployment: Deployment, plugin: str
-    ) -> dict[str, list[str]]:
-        """Tf vars to have the given plugin enabled.
-
-        Return of the function is expected to be passed to set_tfvars_on_enable.
-        """
+    def _horizon_plugins_tfvars(
+        self, deployment: Deployment, plugin: str, enable: bool
+    ) -> dict[str, typing.Any]:
+        """Tf vars with the given horizon plugin added or removed."""
         try:
             tfvars = read_config(
                 deployment.get_client(),
@@ -375,31 +379,32 @@ class OpenStackControlPlaneFeature(EnableDisableFeature, typing.Generic[ConfigTy
             tfvars = {}
 
         horizon_plugins = tfvars.get("horizon-plugins", [])
-        if plugin not in horizon_plugins:
+        if enable and plugin not in horizon_plugins:
             horizon_plugins.append(plugin)
+        elif not enable and plugin in horizon_plugins:
+            horizon_plugins.remove(plugin)
 
         return {"horizon-plugins": sorted(horizon_plugins)}
 
-    def remove_horizon_plugin_from_tfvars(
+    def add_horizon_plugin_to_tfvars(
         self, deployment: Deployment, plugin: str
-    ) -> dict[str, list[str]]:
-        """TF vars to have the given plugin disabled.
+    ) -> dict[str, typing.Any]:
+        """Tf vars to have the given plugin enabled.
 
-        Return of the function is expected to be passed to set_tfvars_on_disable.
+        Callers are expected to return this from set_tfvars_on_enable and
+        may add their own keys to the returned dict.
         """
-        try:
-            tfvars = read_config(
-                deployment.get_client(),
-                self.get_tfvar_config_key(),
-            )
-        except ConfigItemNotFoundException:
-            tfvars = {}
+        return self._horizon_plugins_tfvars(deployment, plugin, enable=True)
 
-        horizon_plugins = tfvars.get("horizon-plugins", [])
-        if plugin in horizon_plugins:
-            horizon_plugins.remove(plugin)
+    def remove_horizon_plugin_from_tfvars(
+        self, deployment: Deployment, plugin: str
+    ) -> dict[str, typing.Any]:
+        """TF vars to have the given plugin disabled.
 
-        return {"horizon-plugins": sorted(horizon_plugins)}
+        Callers are expected to return this from set_tfvars_on_disable and
+        may add their own keys to the returned dict.
+        """
+        return self._horizon_plugins_tfvars(deployment, plugin, enable=False)
 
     def upgrade_hook(
         self,
@@ -8,7 +8,6 @@ from pathlib import Path
 
 import click
 import yaml
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.clusterd.service import (
@@ -34,6 +33,7 @@ from sunbeam.core.juju import (
 from sunbeam.core.manifest import CharmManifest, FeatureConfig, SoftwareConfig
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformException, TerraformInitStep
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -258,7 +258,7 @@ class AddLDAPDomainStep(BaseStep, JujuStepHelper):
 
 
 class LDAPFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "ldap"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
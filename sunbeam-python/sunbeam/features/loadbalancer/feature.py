@@ -11,7 +11,6 @@ from textwrap import dedent
 import click
 import pydantic
 import yaml
-from packaging.version import Version
 from rich.console import Console
 from rich.table import Table
 
@@ -68,7 +67,7 @@ from sunbeam.features.interface.utils import (
     is_ca_certificate,
     is_certificate_valid,
 )
-from sunbeam.features.interface.v1.base import FeatureRequirement
+from sunbeam.features.interface.v1.base import FeatureRequirement, LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -92,6 +91,8 @@ from sunbeam.versions import (
 )
 
 LOG = logging.getLogger(__name__)
+# Computed once at import; the terraform plan sources never move at runtime.
+_ETC_DIR = Path(__file__).resolve().parent / "etc"
 console = Console()
 
 # Terraform plan names and directories for CNI infra/setup
@@ -487,7 +488,7 @@ class AmphoraConfigStep(BaseStep):
         cfg = self.feature_config
         if not cfg.model_fields_set:
             return {}
-        return {k: v for k, v in cfg.model_dump().items() if k in cfg.model_fields_set}
+        return cfg.model_dump(include=cfg.model_fields_set)
 
     def prompt(
         self,
@@ -1498,7 +1499,7 @@ class UpdateOctaviaAmphoraConfigStep(BaseStep, JujuStepHelper):
 
 
 class LoadbalancerFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "loadbalancer"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -1578,10 +1579,10 @@ class LoadbalancerFeature(OpenStackControlPlaneFeature):
             },
             terraform={
                 self.cni_tfplan: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / self.cni_tfplan_dir
+                    source=_ETC_DIR / self.cni_tfplan_dir
                 ),
                 self.setup_tfplan: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / self.setup_tfplan_dir
+                    source=_ETC_DIR / self.setup_tfplan_dir
                 ),
             },
         )
@@ -1631,19 +1632,21 @@ class LoadbalancerFeature(OpenStackControlPlaneFeature):
         self, deployment: Deployment, config: FeatureConfig
     ) -> dict:
         """Set terraform variables to enable the application."""
-        return {
+        tfvars = self.add_horizon_plugin_to_tfvars(deployment, "octavia")
+        tfvars |= {
             "enable-octavia": True,
-            **self.add_horizon_plugin_to_tfvars(deployment, "octavia"),
         }
+        return tfvars
 
     def set_tfvars_on_disable(self, deployment: Deployment) -> dict:
         """Set terraform variables to disable the application."""
-        return {
+        tfvars = self.remove_horizon_plugin_from_tfvars(deployment, "octavia")
+        tfvars |= {
             "enable-octavia": False,
             "octavia-config": {},
             "octavia-to-tls-provider": None,
-            **self.remove_horizon_plugin_from_tfvars(deployment, "octavia"),
         }
+        return tfvars
 
     def set_tfvars_on_resize(
         self, deployment: Deployment, config: FeatureConfig
@@ -4,7 +4,6 @@
 import logging
 
 import click
-from packaging.version import Version
 
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.manifest import FeatureConfig
@@ -12,6 +11,7 @@ from sunbeam.features.interface.v1.base import (
     ConfigType,
     EnableDisableFeature,
     FeatureRequirement,
+    LazyVersion,
 )
 from sunbeam.features.maintenance.commands import (
     disable as disable_maintenance_cmd,
@@ -25,10 +25,10 @@ LOG = logging.getLogger(__name__)
 
 
 class MaintenanceFeature(EnableDisableFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     # Compute role maintenance depends on watcher
-    requires = {FeatureRequirement("resource-optimization")}
+    requires = frozenset({FeatureRequirement("resource-optimization")})
 
     name = "maintenance"
     generally_available = False
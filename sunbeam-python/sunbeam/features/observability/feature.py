@@ -16,7 +16,6 @@ import queue
 from pathlib import Path
 
 import click
-from packaging.version import Version
 from rich.console import Console
 from rich.table import Table
 
@@ -74,6 +73,7 @@ from sunbeam.core.terraform import (
 from sunbeam.features.interface.v1.base import (
     BaseFeatureGroup,
     FeatureRequirement,
+    LazyVersion,
     is_maas_deployment,
 )
 from sunbeam.features.interface.v1.openstack import (
@@ -92,6 +92,8 @@ from sunbeam.utils import click_option_show_hints, pass_method_obj
 from sunbeam.versions import TRAEFIK_CHANNEL
 
 LOG = logging.getLogger(__name__)
+# Computed once at import; the terraform plan sources never move at runtime.
+_ETC_DIR = Path(__file__).resolve().parent / "etc"
 console = Console()
 
 OBSERVABILITY_FEATURE_KEY = "ObservabilityProviderType"
@@ -946,12 +948,12 @@ class RemoveRemoteCosOffersStep(BaseStep, JujuStepHelper):
         model_status = self.jhelper.get_model_status(model)
         for endpoint in endpoints:
             app, relation = endpoint.split(":")
-            if app not in model_status.apps:
-                continue
-            app_status = model_status.apps[app]
-            if relation in app_status.relations:
-                relations.append((endpoint, app_status.relations[relation]))
+            app_status = model_status.apps.get(app)
+            if app_status is None:
                 continue
+            relation_status = app_status.relations.get(relation)
+            if relation_status is not None:
+                relations.append((endpoint, relation_status))
 
         return relations
 
@@ -1003,8 +1005,8 @@ class ObservabilityFeatureGroup(BaseFeatureGroup):
 
 
 class ObservabilityFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
-    requires = {FeatureRequirement("telemetry")}
+    version = LazyVersion("0.0.1")
+    requires = frozenset({FeatureRequirement("telemetry")})
 
     # name = "observability"
     group = ObservabilityFeatureGroup
@@ -1057,22 +1059,16 @@ class ObservabilityFeature(OpenStackControlPlaneFeature):
             },
             terraform={
                 self.tfplan_cos: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / self.tfplan_cos_dir
+                    source=_ETC_DIR / self.tfplan_cos_dir
                 ),
                 self.tfplan_observability_agent: TerraformManifest(
-                    source=Path(__file__).parent
-                    / "etc"
-                    / self.tfplan_observability_agent_dir
+                    source=_ETC_DIR / self.tfplan_observability_agent_dir
                 ),
                 self.tfplan_observability_agent_infra: TerraformManifest(
-                    source=Path(__file__).parent
-                    / "etc"
-                    / self.tfplan_observability_agent_infra_dir
+                    source=_ETC_DIR / self.tfplan_observability_agent_infra_dir
                 ),
                 self.tfplan_hardware_observer: TerraformManifest(
-                    source=Path(__file__).parent
-                    / "etc"
-                    / self.tfplan_hardware_observer_dir
+                    source=_ETC_DIR / self.tfplan_hardware_observer_dir
                 ),
             },
         )
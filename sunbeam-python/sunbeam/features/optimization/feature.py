@@ -4,11 +4,10 @@
 import logging
 
 import click
-from packaging.version import Version
 
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.manifest import CharmManifest, FeatureConfig, SoftwareConfig
-from sunbeam.features.interface.v1.base import FeatureRequirement
+from sunbeam.features.interface.v1.base import FeatureRequirement, LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -20,8 +19,8 @@ LOG = logging.getLogger(__name__)
 
 
 class ResourceOptimizationFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
-    requires = {FeatureRequirement("telemetry")}
+    version = LazyVersion("0.0.1")
+    requires = frozenset({FeatureRequirement("telemetry")})
 
     name = "resource-optimization"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -65,9 +64,9 @@ class ResourceOptimizationFeature(OpenStackControlPlaneFeature):
         self, deployment: Deployment, config: FeatureConfig
     ) -> dict:
         """Set terraform variables to enable the application."""
-        tfvars = {
+        tfvars = self.add_horizon_plugin_to_tfvars(deployment, "watcher")
+        tfvars |= {
             "enable-watcher": True,
-            **self.add_horizon_plugin_to_tfvars(deployment, "watcher"),
         }
 
         if deployment.get_client().cluster.list_nodes_by_role("storage"):
@@ -77,10 +76,9 @@ class ResourceOptimizationFeature(OpenStackControlPlaneFeature):
 
     def set_tfvars_on_disable(self, deployment: Deployment) -> dict:
         """Set terraform variables to disable the application."""
-        return {
-            "enable-watcher": False,
-            **self.remove_horizon_plugin_from_tfvars(deployment, "watcher"),
-        }
+        tfvars = self.remove_horizon_plugin_from_tfvars(deployment, "watcher")
+        tfvars["enable-watcher"] = False
+        return tfvars
 
     def set_tfvars_on_resize(
         self, deployment: Deployment, config: FeatureConfig
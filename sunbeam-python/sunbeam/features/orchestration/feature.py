@@ -1,13 +1,14 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import copy
 import logging
 
 import click
-from packaging.version import Version
 
 from sunbeam.core.deployment import Deployment
 from sunbeam.core.manifest import CharmManifest, FeatureConfig, SoftwareConfig
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -19,11 +20,13 @@ LOG = logging.getLogger(__name__)
 
 
 class OrchestrationFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "orchestration"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
 
+    _tfvar_map: dict | None = None
+
     def default_software_overrides(self) -> SoftwareConfig:
         """Feature software configuration."""
         return SoftwareConfig(
@@ -32,17 +35,21 @@ class OrchestrationFeature(OpenStackControlPlaneFeature):
 
     def manifest_attributes_tfvar_map(self) -> dict:
         """Manifest attributes terraformvars map."""
-        return {
-            self.tfplan: {
-                "charms": {
-                    "heat-k8s": {
-                        "channel": "heat-channel",
-                        "revision": "heat-revision",
-                        "config": "heat-config",
+        if self._tfvar_map is None:
+            self._tfvar_map = {
+                self.tfplan: {
+                    "charms": {
+                        "heat-k8s": {
+                            "channel": "heat-channel",
+                            "revision": "heat-revision",
+                            "config": "heat-config",
+                        }
                     }
                 }
             }
-        }
+        # Deep copy: FeatureManager merges these maps in place, which would
+        # otherwise corrupt the cache for sibling openstack-plan features
+        return copy.deepcopy(self._tfvar_map)
 
     def set_application_names(self, deployment: Deployment) -> list:
         """Application names handled by the terraform plan."""
@@ -56,17 +63,15 @@ class OrchestrationFeature(OpenStackControlPlaneFeature):
         self, deployment: Deployment, config: FeatureConfig
     ) -> dict:
         """Set terraform variables to enable the application."""
-        return {
-            "enable-heat": True,
-            **self.add_horizon_plugin_to_tfvars(deployment, "heat"),
-        }
+        tfvars = self.add_horizon_plugin_to_tfvars(deployment, "heat")
+        tfvars["enable-heat"] = True
+        return tfvars
 
     def set_tfvars_on_disable(self, deployment: Deployment) -> dict:
         """Set terraform variables to disable the application."""
-        return {
-            "enable-heat": False,
-            **self.remove_horizon_plugin_from_tfvars(deployment, "heat"),
-        }
+        tfvars = self.remove_horizon_plugin_from_tfvars(deployment, "heat")
+        tfvars["enable-heat"] = False
+        return tfvars
 
     def set_tfvars_on_resize(
         self, deployment: Deployment, config: FeatureConfig
@@ -9,7 +9,6 @@ from pathlib import Path
 
 import click
 import pydantic
-from packaging.version import Version
 from rich.console import Console
 from snaphelpers import Snap
 
@@ -29,13 +28,15 @@ from sunbeam.core.terraform import (
     TerraformInitStep,
     TerraformStateLockedException,
 )
-from sunbeam.features.interface.v1.base import EnableDisableFeature
+from sunbeam.features.interface.v1.base import EnableDisableFeature, LazyVersion
 from sunbeam.utils import (
     click_option_show_hints,
     pass_method_obj,
 )
 
 LOG = logging.getLogger(__name__)
+# Computed once at import; the terraform plan sources never move at runtime.
+_ETC_DIR = Path(__file__).resolve().parent / "etc"
 console = Console()
 
 APPLICATION = "ubuntu-pro"
@@ -172,7 +173,7 @@ class DisableUbuntuProApplicationStep(BaseStep, JujuStepHelper):
 
 class ProFeature(EnableDisableFeature):
     _manifest: Manifest | None
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "pro"
 
@@ -198,9 +199,7 @@ class ProFeature(EnableDisableFeature):
         """Feature software configuration."""
         return SoftwareConfig(
             terraform={
-                self.tfplan: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / self.tfplan_dir
-                )
+                self.tfplan: TerraformManifest(source=_ETC_DIR / self.tfplan_dir)
             }
         )
 
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import BaseStep, run_plan
@@ -16,7 +15,11 @@ from sunbeam.core.manifest import (
 )
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformInitStep
-from sunbeam.features.interface.v1.base import ConfigType, FeatureRequirement
+from sunbeam.features.interface.v1.base import (
+    ConfigType,
+    FeatureRequirement,
+    LazyVersion,
+)
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -32,9 +35,9 @@ console = Console()
 
 
 class SecretsFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.2")
+    version = LazyVersion("0.0.2")
 
-    requires = {FeatureRequirement("vault>1")}
+    requires = frozenset({FeatureRequirement("vault>1")})
     name = "secrets"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
 
@@ -5,7 +5,6 @@ import logging
 from pathlib import Path
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import (
@@ -26,6 +25,7 @@ from sunbeam.core.manifest import (
 from sunbeam.core.terraform import (
     TerraformInitStep,
 )
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -43,11 +43,13 @@ MANILA_DATA_CONFIG_KEY = "TerraformVarsFeatureManilaDataPlan"
 MANILA_DATA_APP = "manila-data"
 
 LOG = logging.getLogger(__name__)
+# Computed once at import; the terraform plan sources never move at runtime.
+_ETC_DIR = Path(__file__).resolve().parent / "etc"
 console = Console()
 
 
 class SharedFilesystemFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "shared-filesystem"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -68,7 +70,7 @@ class SharedFilesystemFeature(OpenStackControlPlaneFeature):
             },
             terraform={
                 self.tfplan_manila_data: TerraformManifest(
-                    source=Path(__file__).parent / "etc" / self.tfplan_manila_data_dir
+                    source=_ETC_DIR / self.tfplan_manila_data_dir
                 ),
             },
         )
@@ -190,21 +192,23 @@ class SharedFilesystemFeature(OpenStackControlPlaneFeature):
         self, deployment: Deployment, config: FeatureConfig
     ) -> dict:
         """Set terraform variables to enable the application."""
-        return {
+        tfvars = self.add_horizon_plugin_to_tfvars(deployment, "manila")
+        tfvars |= {
             "enable-manila": True,
             "enable-manila-cephfs": True,
             "enable-ceph-nfs": True,
-            **self.add_horizon_plugin_to_tfvars(deployment, "manila"),
         }
+        return tfvars
 
     def set_tfvars_on_disable(self, deployment: Deployment) -> dict:
         """Set terraform variables to disable the application."""
-        return {
+        tfvars = self.remove_horizon_plugin_from_tfvars(deployment, "manila")
+        tfvars |= {
             "enable-manila": False,
             "enable-manila-cephfs": False,
             "enable-ceph-nfs": False,
-            **self.remove_horizon_plugin_from_tfvars(deployment, "manila"),
         }
+        return tfvars
 
     def set_tfvars_on_resize(
         self, deployment: Deployment, config: FeatureConfig
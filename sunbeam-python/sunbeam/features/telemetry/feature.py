@@ -4,7 +4,6 @@
 import logging
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import BaseStep, run_plan
@@ -18,6 +17,7 @@ from sunbeam.core.manifest import (
 )
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.terraform import TerraformInitStep
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     DisableOpenStackApplicationStep,
     EnableOpenStackApplicationStep,
@@ -37,7 +37,7 @@ console = Console()
 
 
 class TelemetryFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "telemetry"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
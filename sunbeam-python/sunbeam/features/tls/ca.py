@@ -7,7 +7,6 @@ from pathlib import Path
 import click
 import pydantic
 import yaml
-from packaging.version import Version
 from rich.console import Console
 from rich.table import Table
 
@@ -35,6 +34,7 @@ from sunbeam.features.interface.utils import (
     validate_ca_certificate,
     validate_ca_chain,
 )
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     TerraformPlanLocation,
     WaitForApplicationsStep,
@@ -65,7 +65,7 @@ class CaTlsFeatureConfig(TlsFeatureConfig):
 
 
 class CaTlsFeature(TlsFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "tls.ca"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
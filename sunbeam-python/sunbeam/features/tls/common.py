@@ -8,7 +8,6 @@ import logging
 
 import click
 import pydantic
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.clusterd.client import Client
@@ -44,7 +43,7 @@ from sunbeam.features.interface.utils import (
     is_certificate_valid,
     normalize_pem,
 )
-from sunbeam.features.interface.v1.base import BaseFeatureGroup
+from sunbeam.features.interface.v1.base import BaseFeatureGroup, LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     WaitForApplicationsStep,
@@ -82,7 +81,7 @@ class TlsFeatureGroup(BaseFeatureGroup):
 
 
 class TlsFeature(OpenStackControlPlaneFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
     group = TlsFeatureGroup
 
     def ca_cert_name(self, region: str | None) -> str:
@@ -2,7 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import click
-from packaging.version import Version
 from rich.console import Console
 
 from sunbeam.core.common import BaseStep, run_plan, update_config
@@ -18,6 +17,7 @@ from sunbeam.features.interface.utils import (
     encode_base64_as_string,
     is_certificate_valid,
 )
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     TerraformPlanLocation,
     WaitForApplicationsStep,
@@ -37,7 +37,7 @@ CA_CERTIFICATE_ACTION = "get-ca-certificate"
 
 
 class SelfSignedTlsFeature(TlsFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
     name = "tls.self-signed"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -8,7 +8,6 @@ from pathlib import Path
 import click
 import pydantic
 import yaml
-from packaging.version import Version
 from rich.console import Console
 from rich.table import Table
 
@@ -33,7 +32,7 @@ from sunbeam.features.interface.utils import (
     validate_ca_certificate,
     validate_ca_chain,
 )
-from sunbeam.features.interface.v1.base import FeatureRequirement
+from sunbeam.features.interface.v1.base import FeatureRequirement, LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     TerraformPlanLocation,
     WaitForApplicationsStep,
@@ -72,9 +71,9 @@ class VaultTlsFeatureConfig(TlsFeatureConfig):
 
 
 class VaultTlsFeature(TlsFeature):
-    version = Version("0.0.1")
+    version = LazyVersion("0.0.1")
 
-    requires = {FeatureRequirement("vault>1")}
+    requires = frozenset({FeatureRequirement("vault>1")})
     name = "tls.vault"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
 
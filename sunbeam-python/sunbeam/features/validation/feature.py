@@ -11,7 +11,6 @@ from typing import Any
 import click
 import pydantic
 from croniter import croniter
-from packaging.version import Version
 from rich import box
 from rich.console import Console
 from rich.table import Column, Table
@@ -37,6 +36,7 @@ from sunbeam.core.terraform import (
     TerraformStateLockedException,
 )
 from sunbeam.feature_manager import FeatureManager
+from sunbeam.features.interface.v1.base import LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     OpenStackControlPlaneFeature,
     TerraformPlanLocation,
@@ -249,7 +249,7 @@ class ConfigureValidationStep(BaseStep):
 class ValidationFeature(OpenStackControlPlaneFeature, JujuStepHelper):
     """Deploy tempest to openstack model."""
 
-    version = Version(FEATURE_VERSION)
+    version = LazyVersion(FEATURE_VERSION)
 
     name = "validation"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
@@ -56,7 +56,7 @@ from sunbeam.core.manifest import (
 from sunbeam.core.openstack import OPENSTACK_MODEL
 from sunbeam.core.questions import get_stdin_reopen_tty
 from sunbeam.core.terraform import TerraformInitStep
-from sunbeam.features.interface.v1.base import ConfigType
+from sunbeam.features.interface.v1.base import ConfigType, LazyVersion
 from sunbeam.features.interface.v1.openstack import (
     EnableOpenStackApplicationStep,
     OpenStackControlPlaneFeature,
@@ -607,7 +607,7 @@ class VaultStatusStep(BaseStep):
 
 
 class VaultFeature(OpenStackControlPlaneFeature):
-    version = Version("1.0.1")
+    version = LazyVersion("1.0.1")
 
     name = "vault"
     tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
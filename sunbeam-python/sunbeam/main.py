@@ -10,22 +10,11 @@ from snaphelpers import Snap
 
 from sunbeam import log
 from sunbeam.commands import configure as configure_cmds
-from sunbeam.commands import dashboard as dashboard_cmds
-from sunbeam.commands import generate_cloud_config as generate_cloud_config_cmds
-from sunbeam.commands import juju_utils as juju_cmds
-from sunbeam.commands import launch as launch_cmds
-from sunbeam.commands import manifest as manifest_cmds
-from sunbeam.commands import openrc as openrc_cmds
-from sunbeam.commands import plans as plans_cmd
-from sunbeam.commands import prepare_node as prepare_node_cmds
-from sunbeam.commands import proxy as proxy_cmds
-from sunbeam.commands import sso as sso_cmd
-from sunbeam.commands import utils as utils_cmds
 from sunbeam.core import deployments as deployments_jobs
 from sunbeam.feature_gates import FeatureGateError, validate_feature_gate_config
 from sunbeam.feature_manager import list_feature_gates, list_features
 from sunbeam.provider import commands as provider_cmds
-from sunbeam.utils import CatchGroup, clean_env
+from sunbeam.utils import CatchGroup, LazyGroup, clean_env
 
 LOG = logging.getLogger()
 
@@ -34,7 +23,19 @@ LOG = logging.getLogger()
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
 
 
-@click.group("init", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "init",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "prepare-node-script": "sunbeam.commands.prepare_node:prepare_node_script",
+        "cloud-config": "sunbeam.commands.generate_cloud_config:cloud_config",
+        "launch": "sunbeam.commands.launch:launch",
+        "openrc": "sunbeam.commands.openrc:openrc",
+        "dashboard": "sunbeam.commands.dashboard:dashboard",
+        "plans": "sunbeam.commands.plans:plans",
+    },
+)
 @click.option("--quiet", "-q", default=False, is_flag=True)
 @click.option("--verbose", "-v", default=False, is_flag=True)
 @click.pass_context
@@ -47,27 +48,63 @@ def cli(ctx, quiet, verbose):
     """
 
 
-@click.group("identity", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "identity",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "set-saml-x509": "sunbeam.commands.sso:set_saml_x509",
+    },
+)
 @click.pass_context
 def identity_group(ctx):
     """Manage identity settings."""
     pass
 
 
-@identity_group.group("provider")
+@identity_group.group(
+    "provider",
+    cls=LazyGroup,
+    lazy_subcommands={
+        "list": "sunbeam.commands.sso:list_sso",
+        "add": "sunbeam.commands.sso:add_sso",
+        "remove": "sunbeam.commands.sso:remove_sso",
+        "update": "sunbeam.commands.sso:update_sso",
+        "get-oidc-redirect-url": "sunbeam.commands.sso:get_openid_redirect_uri",
+        "purge": "sunbeam.commands.sso:purge_sso",
+    },
+)
 @click.pass_context
 def provider_group(ctx):
     """Manage identity providers."""
     pass
 
 
-@click.group("manifest", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "manifest",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "list": "sunbeam.commands.manifest:list_manifests",
+        "show": "sunbeam.commands.manifest:show",
+        "generate": "sunbeam.commands.manifest:generate",
+    },
+)
 @click.pass_context
 def manifest(ctx):
     """Manage manifests (read-only commands)."""
 
 
-@click.group("proxy", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "proxy",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "show": "sunbeam.commands.proxy:show",
+        "set": "sunbeam.commands.proxy:set",
+        "clear": "sunbeam.commands.proxy:clear",
+    },
+)
 @click.pass_context
 def proxy(ctx):
     """Manage proxy configuration."""
@@ -91,13 +128,28 @@ def disable(ctx):
     """Disable features."""
 
 
-@click.group("utils", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "utils",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "juju-login": "sunbeam.commands.utils:juju_login",
+    },
+)
 @click.pass_context
 def utils(ctx):
     """Utilities for debugging and managing sunbeam."""
 
 
-@click.group("juju", context_settings=CONTEXT_SETTINGS, cls=CatchGroup)
+@click.group(
+    "juju",
+    context_settings=CONTEXT_SETTINGS,
+    cls=LazyGroup,
+    lazy_subcommands={
+        "register-controller": "sunbeam.commands.juju_utils:register_controller",
+        "unregister-controller": "sunbeam.commands.juju_utils:unregister_controller",
+    },
+)
 @click.pass_context
 def juju(ctx):
     """Utilities for managing juju."""
@@ -117,27 +169,12 @@ def main():
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
-    cli.add_command(prepare_node_cmds.prepare_node_script)
     cli.add_command(configure_cmds.configure)
-    cli.add_command(generate_cloud_config_cmds.cloud_config)
-    cli.add_command(launch_cmds.launch)
-    cli.add_command(openrc_cmds.openrc)
-    cli.add_command(dashboard_cmds.dashboard)
 
     # Add identity group
     cli.add_command(identity_group)
 
-    # Add identity group and commands
     identity_group.add_command(provider_group)
-    identity_group.add_command(sso_cmd.set_saml_x509)
-
-    # Add provider commands
-    provider_group.add_command(sso_cmd.list_sso)
-    provider_group.add_command(sso_cmd.add_sso)
-    provider_group.add_command(sso_cmd.remove_sso)
-    provider_group.add_command(sso_cmd.update_sso)
-    provider_group.add_command(sso_cmd.get_openid_redirect_uri)
-    provider_group.add_command(sso_cmd.purge_sso)
 
     # Cluster management
     provider_cmds.register_providers()
@@ -148,29 +185,19 @@ def main():
 
     # Manifest management
     cli.add_command(manifest)
-    manifest.add_command(manifest_cmds.list_manifests)
-    manifest.add_command(manifest_cmds.show)
-    manifest.add_command(manifest_cmds.generate)
 
     # Proxy management
     cli.add_command(proxy)
-    proxy.add_command(proxy_cmds.show)
-    proxy.add_command(proxy_cmds.set)
-    proxy.add_command(proxy_cmds.clear)
 
     cli.add_command(enable)
     cli.add_command(disable)
 
-    cli.add_command(plans_cmd.plans)
     cli.add_command(list_features)
     cli.add_command(list_feature_gates)
 
     cli.add_command(utils)
-    utils.add_command(utils_cmds.juju_login)
 
     cli.add_command(juju)
-    juju.add_command(juju_cmds.register_controller)
-    juju.add_command(juju_cmds.unregister_controller)
 
     # Register storage backend commands
     deployment.get_storage_manager().register(cli, deployment)
@@ -1873,6 +1873,9 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
     preflight_checks = [DaemonGroupCheck(), JujuLoginCheck(deployment.juju_account)]
     run_preflight_checks(preflight_checks, console)
 
+    # Fetched once and shared by the unit removal steps below.
+    nodes = client.cluster.list_nodes()
+
     plan: list[BaseStep] = []
 
     if not force:
@@ -1928,13 +1931,13 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
                 force,
             ),
             RemoveCinderVolumeUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
+                client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
             ),
             RemoveMicrocephUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
+                client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
             ),
             RemoveMicroOVNUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
+                client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
             ),
             CordonK8SUnitStep(
                 client, name, jhelper, deployment.openstack_machines_model
@@ -1947,7 +1950,7 @@ def remove(ctx: click.Context, name: str, force: bool, show_hints: bool) -> None
                 remove_pvc=True,
             ),
             RemoveK8SUnitsStep(
-                client, name, jhelper, deployment.openstack_machines_model
+                client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
             ),
             EnsureCiliumDeviceByHostStep(
                 deployment,
@@ -1721,6 +1721,9 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
 
     run_plan(check_plan, console, show_hints)
 
+    # Fetched once and shared by the unit removal steps below.
+    nodes = client.cluster.list_nodes()
+
     plan = [
         MigrateK8SKubeconfigStep(
             client, name, jhelper, deployment.openstack_machines_model
@@ -1735,19 +1738,21 @@ def remove_node(ctx: click.Context, name: str, force: bool, show_hints: bool) ->
             force,
         ),
         RemoveCinderVolumeUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
+            client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
         ),
         RemoveMicrocephUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
+            client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
         ),
         RemoveMicroOVNUnitsStep(
-            client, name, jhelper, deployment.openstack_machines_model
+            client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
         ),
         CordonK8SUnitStep(client, name, jhelper, deployment.openstack_machines_model),
         DrainK8SUnitStep(
             client, name, jhelper, deployment.openstack_machines_model, remove_pvc=True
         ),
-        RemoveK8SUnitsStep(client, name, jhelper, deployment.openstack_machines_model),
+        RemoveK8SUnitsStep(
+            client, name, jhelper, deployment.openstack_machines_model, nodes=nodes
+        ),
         EnsureCiliumDeviceByHostStep(
             deployment,
             client,
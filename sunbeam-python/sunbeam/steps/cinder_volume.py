@@ -75,6 +75,7 @@ class DeployCinderVolumeApplicationStep(DeployMachineApplicationStep):
         manifest: Manifest,
         model: str,
         extra_tfvars: dict | None = None,
+        skip_apply_if_unchanged: bool = False,
     ):
         super().__init__(
             deployment,
@@ -88,6 +89,7 @@ class DeployCinderVolumeApplicationStep(DeployMachineApplicationStep):
             [Role.STORAGE],
             "Deploy Cinder Volume",
             "Deploying Cinder Volume",
+            skip_apply_if_unchanged=skip_apply_if_unchanged,
         )
         self._offers: dict[str, str | None] = {}
         self._optional_offers: dict[str, str | None] = {}
@@ -213,7 +215,12 @@ class RemoveCinderVolumeUnitsStep(RemoveMachineUnitsStep):
     """Remove Cinder Volume Unit."""
 
     def __init__(
-        self, client: Client, names: list[str] | str, jhelper: JujuHelper, model: str
+        self,
+        client: Client,
+        names: list[str] | str,
+        jhelper: JujuHelper,
+        model: str,
+        nodes: list[dict] | None = None,
     ):
         super().__init__(
             client,
@@ -224,6 +231,7 @@ class RemoveCinderVolumeUnitsStep(RemoveMachineUnitsStep):
             model,
             "Remove Cinder Volume unit(s)",
             "Removing Cinder Volume unit(s) from machine",
+            nodes=nodes,
         )
 
     def get_unit_timeout(self) -> int:
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import dataclasses
 import itertools
 import json
 import logging
@@ -1326,11 +1327,14 @@ class WriteJujuStatusStep(BaseStep, JujuStepHelper):
         try:
             LOG.debug("Getting Juju status for model %s", self.model)
             model_status = self.jhelper.get_model_status(self.model)
-            LOG.debug("Model %s status: %s", self.model, model_status)
 
             if not self.file_path.exists():
                 self.file_path.touch()
             self.file_path.chmod(0o660)
+            if dataclasses.is_dataclass(model_status):
+                model_status = dataclasses.asdict(model_status)
+            # Stream straight into the file handle rather than building the
+            # whole document as a string first
             with self.file_path.open("w") as file:
                 json.dump(model_status, file, ensure_ascii=False, indent=4)
             return Result(ResultType.COMPLETED, "Inspecting Model Status")
@@ -1461,31 +1465,33 @@ class JujuLoginStep(BaseStep, JujuStepHelper):
                 ResultType.FAILED,
                 "Juju account was supposed to be checked for in is_skip method.",
             )
-        cmd = " ".join(
-            [
-                self._get_juju_binary(),
-                "login",
-                "--user",
-                self.juju_account.user,
-            ]
-        )
+        cmd = [
+            self._get_juju_binary(),
+            "login",
+            "--user",
+            self.juju_account.user,
+        ]
         if self.controller:
-            cmd += f" -c {self.controller}"
+            cmd.extend(["-c", self.controller])
 
-        LOG.debug("Running command %s", cmd)
-        with pexpect.spawn(cmd) as process:
-            try:
-                process.expect("^please enter password", timeout=PEXPECT_TIMEOUT)
-                process.sendline(self.juju_account.password)
-                process.expect(pexpect.EOF, timeout=PEXPECT_TIMEOUT)
-            except pexpect.TIMEOUT as e:
-                LOG.debug("Process timeout", exc_info=True)
-                return Result(ResultType.FAILED, str(e))
+        LOG.debug("Running command %s", " ".join(cmd))
+        # juju login reads the password from stdin, no need for a pty
+        try:
+            process = subprocess.run(
+                cmd,
+                input=f"{self.juju_account.password}\n",
+                capture_output=True,
+                text=True,
+                timeout=PEXPECT_TIMEOUT,
+            )
+        except subprocess.TimeoutExpired as e:
+            LOG.debug("Process timeout", exc_info=True)
+            return Result(ResultType.FAILED, str(e))
 
-            LOG.debug("Command stdout=%r", process.before)
-            if process.exitstatus != 0:
-                return Result(ResultType.FAILED, "Failed to login to Juju Controller")
-            return Result(ResultType.COMPLETED)
+        LOG.debug("Command stdout=%r stderr=%r", process.stdout, process.stderr)
+        if process.returncode != 0:
+            return Result(ResultType.FAILED, "Failed to login to Juju Controller")
+        return Result(ResultType.COMPLETED)
 
 
 class AddJujuModelStep(BaseStep):
@@ -547,6 +547,7 @@ class RemoveK8SUnitsStep(RemoveMachineUnitsStep):
         names: list[str] | str,
         jhelper: JujuHelper,
         model: str,
+        nodes: list[dict] | None = None,
     ):
         super().__init__(
             client,
@@ -557,6 +558,7 @@ class RemoveK8SUnitsStep(RemoveMachineUnitsStep):
             model,
             f"Remove {self._APPLICATION} unit",
             f"Removing {self._APPLICATION} unit from machine",
+            nodes=nodes,
         )
 
     def get_unit_timeout(self) -> int:
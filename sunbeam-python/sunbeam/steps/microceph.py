@@ -104,6 +104,7 @@ class DeployMicrocephApplicationStep(DeployMachineApplicationStep):
         manifest: Manifest,
         model: str,
         wait_for_readiness: bool = True,
+        skip_apply_if_unchanged: bool = False,
     ):
         super().__init__(
             deployment,
@@ -118,6 +119,7 @@ class DeployMicrocephApplicationStep(DeployMachineApplicationStep):
             "Deploy MicroCeph",
             "Deploying MicroCeph",
             wait_for_readiness=wait_for_readiness,
+            skip_apply_if_unchanged=skip_apply_if_unchanged,
         )
 
     def get_application_timeout(self) -> int:
@@ -213,7 +215,12 @@ class RemoveMicrocephUnitsStep(RemoveMachineUnitsStep):
     """Remove Microceph Unit."""
 
     def __init__(
-        self, client: Client, names: list[str] | str, jhelper: JujuHelper, model: str
+        self,
+        client: Client,
+        names: list[str] | str,
+        jhelper: JujuHelper,
+        model: str,
+        nodes: list[dict] | None = None,
     ):
         super().__init__(
             client,
@@ -224,6 +231,7 @@ class RemoveMicrocephUnitsStep(RemoveMachineUnitsStep):
             model,
             "Remove MicroCeph unit(s)",
             "Removing MicroCeph unit(s) from machine",
+            nodes=nodes,
         )
 
     def get_unit_timeout(self) -> int:
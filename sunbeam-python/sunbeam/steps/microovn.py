@@ -220,7 +220,7 @@ class ReapplyMicroOVNTerraformPlanStep(BaseStep):
         return Result(ResultType.SKIPPED)
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=convert_retry_failure_as_result,
@@ -270,7 +270,12 @@ class RemoveMicroOVNUnitsStep(RemoveMachineUnitsStep):
     """Remove MicroOVN Unit."""
 
     def __init__(
-        self, client: Client, names: list[str] | str, jhelper: JujuHelper, model: str
+        self,
+        client: Client,
+        names: list[str] | str,
+        jhelper: JujuHelper,
+        model: str,
+        nodes: list[dict] | None = None,
     ):
         super().__init__(
             client,
@@ -281,6 +286,7 @@ class RemoveMicroOVNUnitsStep(RemoveMachineUnitsStep):
             model,
             "Remove MicroOVN unit",
             "Removing MicroOVN unit from machine",
+            nodes=nodes,
         )
 
     def get_unit_timeout(self) -> int:
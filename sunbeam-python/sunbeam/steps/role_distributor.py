@@ -174,7 +174,7 @@ class ReapplyRoleDistributorApplicationStep(BaseStep):
         self.model = model
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=convert_retry_failure_as_result,
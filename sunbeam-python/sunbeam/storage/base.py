@@ -44,6 +44,9 @@ from sunbeam.storage.steps import (
 
 LOG = logging.getLogger(__name__)
 console = Console()
+# Snap-relative location of the self-contained storage terraform plan,
+# computed once at import.
+_DEPLOY_STORAGE_DIR = Path(__file__).resolve().parents[5] / "etc" / "deploy-storage"
 
 # Juju application name validation pattern
 # Based on Juju's naming rules: must start with letter, contain only
@@ -265,10 +268,7 @@ class StorageBackendBase(FeatureGateMixin, typing.Generic[BackendConfig]):
         from sunbeam.core.terraform import TerraformHelper
 
         # Get the plan source path
-        backend_self_contained = (
-            Path(__file__).parent.parent.parent.parent.parent.parent
-            / "etc/deploy-storage"  # / "backends" / self.name / self.tfplan_dir
-        )
+        backend_self_contained = _DEPLOY_STORAGE_DIR
 
         if backend_self_contained.exists():
             plan_source = backend_self_contained
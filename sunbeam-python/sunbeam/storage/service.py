@@ -92,8 +92,8 @@ class StorageBackendService:
             )
 
             # Check if application exists in the model
-            if app_name in model_status.apps:
-                app_status = model_status.apps[app_name]
+            app_status = model_status.apps.get(app_name)
+            if app_status is not None:
                 return app_status.app_status.current
 
             return "not-found"
@@ -118,10 +118,9 @@ class StorageBackendService:
             )
 
             # Check if application exists in the model
-            if app_name in model_status.apps:
-                app_status = model_status.apps[app_name]
-                charm_url = app_status.charm
-                return charm_url
+            app_status = model_status.apps.get(app_name)
+            if app_status is not None:
+                return app_status.charm
 
             return "Not Found"
         except Exception as e:
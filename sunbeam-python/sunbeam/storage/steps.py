@@ -382,7 +382,7 @@ class BaseStorageBackendDeployStep(BaseStep):
         return True
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=friendly_terraform_lock_retry_callback,
@@ -525,7 +525,7 @@ class BaseStorageBackendDestroyStep(BaseStep):
         self.model = model
 
     @tenacity.retry(
-        wait=tenacity.wait_fixed(60),
+        wait=tenacity.wait_random_exponential(multiplier=2, max=60),
         stop=tenacity.stop_after_delay(300),
         retry=tenacity.retry_if_exception_type(TerraformStateLockedException),
         retry_error_callback=friendly_terraform_lock_retry_callback,
@@ -3,6 +3,7 @@
 
 import base64
 import collections.abc
+import importlib
 import ipaddress
 import json
 import logging
@@ -255,6 +256,42 @@ class CatchGroup(click.Group):
             sys.exit(1)
 
 
+class LazyGroup(CatchGroup):
+    """Catch group that imports subcommands on first use.
+
+    Lazy subcommands are declared as ``{name: "module.path:attribute"}`` and
+    the referenced module is only imported when the subcommand is resolved,
+    keeping unused command subtrees off the CLI cold-start path.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return subcommand names, including not yet imported ones."""
+        return sorted(set(self.commands) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Resolve a subcommand, importing its module if necessary."""
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            return self._load_lazy_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        import_path = self.lazy_subcommands[cmd_name]
+        module_name, _, attribute = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"Lazy subcommand {import_path} is not a click command")
+        return command
+
+
 K = typing.TypeVar("K")
 V = typing.TypeVar("V")
 
@@ -191,7 +191,6 @@ def _patch_upgrade_coordinators(mocker):
         "sunbeam.commands.refresh.ChannelUpgradeCoordinator",
         autospec=True,
     )
-    mocker.patch("sunbeam.commands.refresh.JujuHelper", autospec=True)
     mocker.patch("sunbeam.commands.refresh.run_preflight_checks")
     mocker.patch("sunbeam.commands.refresh.run_plan")
 
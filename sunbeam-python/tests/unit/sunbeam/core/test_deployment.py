@@ -60,7 +60,7 @@ def deployment(mocker, snap):
         dep.get_client.side_effect = ValueError("No clusterd in testing...")
         dep.plans_directory = Path("/tmp/plans")
         dep.__setattr__("_tfhelpers", {})
-        dep._manifest = None
+        dep._manifest_cache = {}
         dep.__setattr__("name", "test_deployment")
         dep.get_feature_manager.return_value = Mock(
             get_all_feature_manifests=Mock(return_value={}),
@@ -105,6 +105,7 @@ def jhelper(juju, status) -> jujulib.JujuHelper:
     jhelper = jujulib.JujuHelper.__new__(jujulib.JujuHelper)
     jhelper.controller = "test"
     jhelper._juju = juju
+    jhelper._charm_revisions_cache = {}
     juju.status.return_value = status
     jhelper.models = Mock(
         return_value=[
@@ -201,6 +202,11 @@ def test_remove_unit(jhelper, juju):
     juju.remove_unit.assert_called()
 
 
+def test_remove_unit_batch(jhelper, juju):
+    jhelper.remove_unit("app", ["app/0", "app/1"], "test-model")
+    juju.remove_unit.assert_called_once_with("app/0", "app/1")
+
+
 def test_run_cmd_on_machine_unit_payload_success(jhelper, juju):
     juju.exec = Mock(return_value=Mock(success=True, results={"result": "ok"}))
 
@@ -719,6 +725,30 @@ def test_get_available_charm_revisions(jhelper: jujulib.JujuHelper, juju):
     assert revisions == {"amd64": 121, "arm64": 122}
 
 
+def test_get_available_charm_revisions_memoized(jhelper: jujulib.JujuHelper, juju):
+    cmd_out = {
+        "channels": {
+            "legacy": {
+                "edge": [
+                    {
+                        "revision": 121,
+                        "architectures": ["amd64"],
+                        "bases": [{"name": "ubuntu", "channel": "24.04"}],
+                    },
+                ]
+            }
+        }
+    }
+    juju.cli.return_value = json.dumps(cmd_out)
+    first = jhelper.get_available_charm_revisions("k8s", "legacy/edge")
+    second = jhelper.get_available_charm_revisions("k8s", "legacy/edge")
+    assert first == second == {"amd64": 121}
+    juju.cli.assert_called_once()
+    # Cached copies must not be aliased to the caller's dict
+    first["amd64"] = 999
+    assert jhelper.get_available_charm_revisions("k8s", "legacy/edge") == {"amd64": 121}
+
+
 def test_get_available_charm_revisions_branch_channel(
     jhelper: jujulib.JujuHelper, juju
 ):
@@ -360,3 +360,35 @@ class TestAddManifestStep:
             data=yaml.safe_dump(manifest_mod.EMPTY_MANIFEST)
         )
         assert result.result_type == ResultType.FAILED
+
+
+class TestLoadManifestData:
+    def test_parses_and_caches(self, mocker, snap):
+        mocker.patch.object(manifest_mod, "Snap", return_value=snap)
+        snap.paths.user_common.mkdir(parents=True)
+
+        data = manifest_mod.load_manifest_data(test_manifest)
+
+        assert data == yaml.safe_load(test_manifest)
+        cache_file = snap.paths.user_common / "manifest.cache"
+        assert cache_file.exists()
+
+        # A repeat call with the same payload must not re-run the YAML parser
+        safe_load = mocker.patch.object(manifest_mod.yaml, "safe_load")
+        assert manifest_mod.load_manifest_data(test_manifest) == data
+        safe_load.assert_not_called()
+
+    def test_stale_cache_is_refreshed(self, mocker, snap):
+        mocker.patch.object(manifest_mod, "Snap", return_value=snap)
+        snap.paths.user_common.mkdir(parents=True)
+
+        manifest_mod.load_manifest_data(test_manifest)
+        data = manifest_mod.load_manifest_data("core: {}")
+
+        assert data == {"core": {}}
+
+    def test_unwritable_cache_falls_back_to_parsing(self, mocker, snap):
+        mocker.patch.object(manifest_mod, "Snap", return_value=snap)
+        # user_common does not exist: both cache read and write fail
+        data = manifest_mod.load_manifest_data(test_manifest)
+        assert data == yaml.safe_load(test_manifest)
@@ -1,7 +1,8 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
-from unittest.mock import Mock, patch
+from collections import namedtuple
+from unittest.mock import patch
 
 import pytest
 import tenacity
@@ -14,6 +15,10 @@ from sunbeam.core.steps import (
 )
 from sunbeam.core.terraform import TerraformException, TerraformStateLockedException
 
+# Lightweight stand-ins for jubilant status objects; far cheaper than MagicMock
+_App = namedtuple("_App", "units")
+_Unit = namedtuple("_Unit", "machine")
+
 
 @pytest.fixture()
 def read_config():
@@ -91,6 +96,7 @@ class TestDeployMachineApplicationStep:
             },
             tf_apply_extra_args=[],
             reporter=step_context.reporter,
+            skip_apply_if_unchanged=False,
         )
         assert result.result_type == ResultType.COMPLETED
 
@@ -103,7 +109,7 @@ class TestDeployMachineApplicationStep:
         manifest,
         step_context,
     ):
-        jhelper.get_application.return_value = Mock(units={"app/1": Mock(machine=1)})
+        jhelper.get_application.return_value = _App(units={"app/1": _Unit(machine=1)})
         jhelper.get_model_uuid.return_value = "model-uuid"
         tfhelper.update_tfvars_and_apply_tf.side_effect = TerraformException(
             "apply failed..."
@@ -134,7 +140,7 @@ class TestDeployMachineApplicationStep:
         manifest,
         step_context,
     ):
-        jhelper.get_application.return_value = Mock(units={"app/1": Mock(machine=1)})
+        jhelper.get_application.return_value = _App(units={"app/1": _Unit(machine=1)})
         tfhelper.update_tfvars_and_apply_tf.side_effect = [
             TerraformStateLockedException("apply failed..."),
             None,
@@ -165,7 +171,7 @@ class TestDeployMachineApplicationStep:
         manifest,
         step_context,
     ):
-        jhelper.get_application.return_value = Mock(units={"app/1": Mock(machine=1)})
+        jhelper.get_application.return_value = _App(units={"app/1": _Unit(machine=1)})
         jhelper.wait_application_ready.side_effect = TimeoutError("timed out")
 
         step = DeployMachineApplicationStep(
@@ -189,7 +195,7 @@ class TestRemoveMachineUnitStep:
     def test_is_skip(self, cclient, jhelper, step_context):
         id = "1"
         cclient.cluster.list_nodes.return_value = [{"name": "node-0", "machineid": id}]
-        jhelper.get_application.return_value = Mock(units={"app1/0": Mock(machine=id)})
+        jhelper.get_application.return_value = _App(units={"app1/0": _Unit(machine=id)})
 
         step = RemoveMachineUnitsStep(
             cclient, "node-0", jhelper, "tfconfig", "app1", "model1"
@@ -203,7 +209,9 @@ class TestRemoveMachineUnitStep:
     def test_is_skip_node_missing(self, cclient, jhelper, step_context):
         cclient.cluster.list_nodes.return_value = [{"name": "node-0", "machineid": 1}]
 
-        jhelper.get_application.return_value = Mock(units={"app1/0": Mock()})
+        jhelper.get_application.return_value = _App(
+            units={"app1/0": _Unit(machine=None)}
+        )
         step = RemoveMachineUnitsStep(
             cclient, "node-1", jhelper, "tfconfig", "app1", "model1"
         )
@@ -228,7 +236,7 @@ class TestRemoveMachineUnitStep:
 
     def test_is_skip_unit_missing(self, cclient, jhelper, step_context):
         cclient.cluster.list_nodes.return_value = [{"name": "node-0", "machineid": 1}]
-        jhelper.get_application.return_value = Mock(units={})
+        jhelper.get_application.return_value = _App(units={})
 
         step = RemoveMachineUnitsStep(
             cclient, "node-0", jhelper, "tfconfig", "app1", "model1"
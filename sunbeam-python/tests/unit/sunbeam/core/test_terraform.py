@@ -98,7 +98,7 @@ def deployment():
             Deployment._load_tfhelpers, dep
         )
         dep.__setattr__("_tfhelpers", {})
-        dep._manifest = None
+        dep._manifest_cache = {}
         dep.__setattr__("name", "test_deployment")
         dep.get_feature_manager.return_value = Mock(
             get_all_feature_manifests=Mock(return_value={}),
@@ -231,6 +231,62 @@ class TestTerraformHelper:
             assert "vault-config" in saved_data["_computed_keys"]
             assert "ha-scale" in saved_data["_computed_keys"]
 
+    def test_skip_apply_if_unchanged(
+        self,
+        mocker,
+        snap,
+        copytree,
+        deployment: Deployment,
+        read_config,
+    ):
+        """Test that apply is skipped when the merged tfvars match clusterdb."""
+        tfplan = "openstack-plan"
+        extra_tfvars = {"ha-scale": 3}
+        read_config.return_value = {}
+
+        mocker.patch.object(deployment_mod, "Snap", return_value=snap)
+        mocker.patch.object(manifest_mod, "Snap", return_value=snap)
+        mocker.patch.object(terraform_mod, "Snap", return_value=snap)
+        client = Mock()
+        client.cluster.get_latest_manifest.return_value = {"data": test_manifest}
+        client.cluster.get_config.return_value = "{}"
+        deployment.get_client.return_value = client
+        manifest = deployment.get_manifest()
+
+        tfhelper = deployment.get_tfhelper(tfplan)
+        with (
+            patch.object(tfhelper, "write_tfvars"),
+            patch.object(tfhelper, "apply") as apply,
+            patch("sunbeam.core.terraform.update_config") as update_config,
+        ):
+            tfhelper.update_tfvars_and_apply_tf(
+                client, manifest, "fake-config", extra_tfvars
+            )
+            apply.assert_called_once()
+            update_config.assert_called_once()
+
+            # Re-running with the stored tfvars unchanged skips the apply
+            read_config.return_value = update_config.call_args.args[2]
+            tfhelper.update_tfvars_and_apply_tf(
+                client,
+                manifest,
+                "fake-config",
+                extra_tfvars,
+                skip_apply_if_unchanged=True,
+            )
+            apply.assert_called_once()
+            update_config.assert_called_once()
+
+            # A changed override busts the short-circuit
+            tfhelper.update_tfvars_and_apply_tf(
+                client,
+                manifest,
+                "fake-config",
+                {"ha-scale": 5},
+                skip_apply_if_unchanged=True,
+            )
+            assert apply.call_count == 2
+
     def test_source_tracking_manifest_overrides_computed_for_charm_configs(
         self,
         mocker,
@@ -1,13 +1,15 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import contextlib
+import copy
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
 from sunbeam.core.common import ResultType
 from sunbeam.core.terraform import TerraformException
-from sunbeam.features.interface.v1.openstack import TerraformPlanLocation
 from sunbeam.features.ldap.feature import (
     AddLDAPDomainStep,
     DisableLDAPDomainStep,
@@ -15,247 +17,210 @@ from sunbeam.features.ldap.feature import (
     UpdateLDAPDomainStep,
 )
 
+# Keep the module together on one xdist worker: the config patches are
+# module-scoped and should be installed once.
+pytestmark = pytest.mark.xdist_group("ldap")
 
-@pytest.fixture()
-def read_config():
-    with patch("sunbeam.features.ldap.feature.read_config") as p:
-        yield p
+
+@pytest.fixture(scope="module")
+def config_mocks():
+    """Patch the feature's config helpers once for the module, as one bundle."""
+    with contextlib.ExitStack() as stack:
+        yield SimpleNamespace(
+            read_config=stack.enter_context(
+                patch("sunbeam.features.ldap.feature.read_config")
+            ),
+            update_config=stack.enter_context(
+                patch("sunbeam.features.ldap.feature.update_config")
+            ),
+        )
 
 
-@pytest.fixture()
-def update_config():
-    with patch("sunbeam.features.ldap.feature.update_config") as p:
-        yield p
+@pytest.fixture(autouse=True)
+def reset_mocks(config_mocks):
+    """Reset the module-scoped patches so state does not leak between tests."""
+    config_mocks.read_config.reset_mock(return_value=True, side_effect=True)
+    config_mocks.update_config.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture()
-def ssnap():
-    with patch("sunbeam.clusterd.service.Snap") as p:
-        yield p
+def seeded_config_mocks(config_mocks):
+    """config_mocks with read_config seeded with the single-domain tfvars."""
+    config_mocks.read_config.return_value = copy.deepcopy(APPS_DOM1_CH)
+    return config_mocks
 
 
 class FakeLDAPFeature(LDAPFeature):
+    # Constant attributes and mock collaborators live on the class so
+    # instances are free to construct; name and tf_plan_location are
+    # inherited from LDAPFeature.
+    config_flags = None
+    app_name = "Ldap"
+    tfplan = "fake-plan"
+    _manifest = Mock()
+    deployment = Mock()
+
     def __init__(self):
-        self.config_flags = None
-        self.name = "ldap"
-        self.app_name = self.name.capitalize()
-        self.tf_plan_location = TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO
-        self.tfplan = "fake-plan"
-        self._manifest = Mock()
-        self.deployment = Mock()
+        pass
+
+
+# Shared tfvars snapshots; deepcopy before handing one to read_config as the
+# steps mutate the dict they are given.
+DOM1 = {"domain-name": "dom1"}
+DOM2 = {"domain-name": "dom2"}
+APPS_DOM1 = {"ldap-apps": {"dom1": DOM1}}
+APPS_DOM1_CH = {"ldap-channel": "2023.2/edge", **APPS_DOM1}
+
+# Reusable side effects; only the message is asserted on
+APPLY_FAILED = TerraformException("apply failed...")
+TIMED_OUT = TimeoutError("timed out")
+
+
+# The three domain steps share their is_skip/has_prompts/terraform failure
+# behaviour; exercise those paths once, parametrized over the step classes.
+STEPS = [
+    pytest.param(AddLDAPDomainStep, DOM1, id="add"),
+    pytest.param(UpdateLDAPDomainStep, DOM1, id="update"),
+    pytest.param(DisableLDAPDomainStep, "dom1", id="disable"),
+]
+
+
+def _make_step(step_cls, ctor_arg):
+    if step_cls is UpdateLDAPDomainStep:
+        return UpdateLDAPDomainStep(Mock(), Mock(), FakeLDAPFeature(), ctor_arg)
+    return step_cls(Mock(), Mock(), Mock(), FakeLDAPFeature(), ctor_arg)
+
+
+@pytest.mark.parametrize("step_cls,ctor_arg", STEPS)
+def test_is_skip(step_cls, ctor_arg, step_context):
+    step = _make_step(step_cls, ctor_arg)
+    result = step.is_skip(step_context)
+    assert result.result_type == ResultType.COMPLETED
+
+
+@pytest.mark.parametrize("step_cls,ctor_arg", STEPS)
+def test_has_prompts(step_cls, ctor_arg):
+    step = _make_step(step_cls, ctor_arg)
+    assert not step.has_prompts()
+
+
+@pytest.mark.parametrize("step_cls,ctor_arg", STEPS)
+def test_tf_apply_failed(step_cls, ctor_arg, seeded_config_mocks, snap, step_context):
+    step = _make_step(step_cls, ctor_arg)
+    step.tfhelper.apply.side_effect = APPLY_FAILED
+    result = step.run(step_context)
+    # The happy-path tests check the call arguments; here only the
+    # failure propagation matters
+    assert step.tfhelper.apply.called
+    assert result.result_type == ResultType.FAILED
+    assert result.message == "apply failed..."
 
 
 class TestAddLDAPDomainStep:
-    def setup_method(self):
-        self.jhelper = Mock()
-        self.charm_config = {"domain-name": "dom1"}
-        self.feature = FakeLDAPFeature()
-
-    def test_is_skip(self, step_context):
-        step = AddLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, {})
-        result = step.is_skip(step_context)
-        assert result.result_type == ResultType.COMPLETED
+    @pytest.fixture(scope="class")
+    def env(self):
+        """One mock environment per class instead of one per test."""
+        return SimpleNamespace(
+            jhelper=Mock(),
+            feature=FakeLDAPFeature(),
+            charm_config=DOM1,
+        )
 
-    def test_has_prompts(self):
-        step = AddLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, {})
-        assert not step.has_prompts()
+    @pytest.fixture(autouse=True)
+    def _reset(self, env):
+        env.jhelper.reset_mock(return_value=True, side_effect=True)
 
-    def test_enable_first_domain(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {}
+    def test_enable_first_domain(self, env, config_mocks, snap, step_context):
+        config_mocks.read_config.return_value = {}
         step = AddLDAPDomainStep(
-            Mock(), Mock(), self.jhelper, self.feature, self.charm_config
+            Mock(), Mock(), env.jhelper, env.feature, env.charm_config
         )
         result = step.run(step_context)
-        step.tfhelper.write_tfvars.assert_called_with(
-            {
-                "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-            }
-        )
+        step.tfhelper.write_tfvars.assert_called_with(APPS_DOM1)
         step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
         assert result.result_type == ResultType.COMPLETED
 
-    def test_enable_second_domain(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = AddLDAPDomainStep(
-            Mock(), Mock(), self.jhelper, self.feature, {"domain-name": "dom2"}
-        )
+    def test_enable_second_domain(self, env, config_mocks, snap, step_context):
+        config_mocks.read_config.return_value = copy.deepcopy(APPS_DOM1)
+        step = AddLDAPDomainStep(Mock(), Mock(), env.jhelper, env.feature, DOM2)
         result = step.run(step_context)
         step.tfhelper.write_tfvars.assert_called_with(
-            {
-                "ldap-apps": {
-                    "dom1": {"domain-name": "dom1"},
-                    "dom2": {"domain-name": "dom2"},
-                },
-            }
+            {"ldap-apps": {"dom1": DOM1, "dom2": DOM2}}
         )
         step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
         assert result.result_type == ResultType.COMPLETED
 
-    def test_enable_tf_apply_failed(
-        self, read_config, update_config, snap, step_context
-    ):
-        read_config.return_value = {}
+    def test_enable_waiting_timed_out(self, env, config_mocks, snap, step_context):
+        env.jhelper.wait_until_active.side_effect = TIMED_OUT
+        config_mocks.read_config.return_value = {}
         step = AddLDAPDomainStep(
-            Mock(), Mock(), self.jhelper, self.feature, self.charm_config
+            Mock(), Mock(), env.jhelper, env.feature, env.charm_config
         )
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
         result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once()
-        assert result.result_type == ResultType.FAILED
-        assert result.message == "apply failed..."
-
-    def test_enable_waiting_timed_out(
-        self, read_config, update_config, snap, step_context
-    ):
-        self.jhelper.wait_until_active.side_effect = TimeoutError("timed out")
-        read_config.return_value = {}
-        step = AddLDAPDomainStep(
-            Mock(), Mock(), self.jhelper, self.feature, self.charm_config
-        )
-        result = step.run(step_context)
-        step.tfhelper.write_tfvars.assert_called_with(
-            {
-                "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-            }
-        )
-        step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
+        step.tfhelper.write_tfvars.assert_called_with(APPS_DOM1)
+        assert step.tfhelper.apply.called
         assert result.result_type == ResultType.FAILED
         assert result.message == "timed out"
 
 
 class TestDisableLDAPDomainStep:
-    def setup_method(self):
-        self.jhelper = Mock()
-        self.charm_config = {"domain-name": "dom1"}
-        self.feature = FakeLDAPFeature()
-
-    def test_is_skip(self, step_context):
-        step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom1")
-        result = step.is_skip(step_context)
-        assert result.result_type == ResultType.COMPLETED
+    @pytest.fixture(scope="class")
+    def env(self):
+        """One mock environment per class instead of one per test."""
+        return SimpleNamespace(jhelper=Mock(), feature=FakeLDAPFeature())
 
-    def test_has_prompts(self):
-        step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom1")
-        assert not step.has_prompts()
+    @pytest.fixture(autouse=True)
+    def _reset(self, env):
+        env.jhelper.reset_mock(return_value=True, side_effect=True)
 
-    def test_disable(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom1")
+    def test_disable(self, env, seeded_config_mocks, snap, step_context):
+        step = DisableLDAPDomainStep(Mock(), Mock(), env.jhelper, env.feature, "dom1")
         step.run(step_context)
         step.tfhelper.write_tfvars.assert_called_with(
             {"ldap-channel": "2023.2/edge", "ldap-apps": {}}
         )
         step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
 
-    def test_disable_tf_apply_failed(
-        self, read_config, update_config, snap, step_context
-    ):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom1")
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
-        result = step.run(step_context)
-        step.tfhelper.write_tfvars.assert_called_with(
-            {"ldap-channel": "2023.2/edge", "ldap-apps": {}}
-        )
-        step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
-        assert result.result_type == ResultType.FAILED
-        assert result.message == "apply failed..."
-
-    def test_disable_wrong_domain(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = DisableLDAPDomainStep(Mock(), Mock(), self.jhelper, self.feature, "dom2")
+    def test_disable_wrong_domain(self, env, seeded_config_mocks, snap, step_context):
+        step = DisableLDAPDomainStep(Mock(), Mock(), env.jhelper, env.feature, "dom2")
         result = step.run(step_context)
         assert result.result_type == ResultType.FAILED
         assert result.message == "Domain not found"
 
 
 class TestUpdateLDAPDomainStep:
-    def setup_method(self):
-        self.jhelper = Mock()
-        self.charm_config = {"domain-name": "dom1"}
-        self.feature = FakeLDAPFeature()
-
-    def test_is_skip(self, step_context):
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, self.charm_config
+    @pytest.fixture(scope="class")
+    def env(self):
+        """One mock environment per class instead of one per test."""
+        return SimpleNamespace(
+            jhelper=Mock(),
+            feature=FakeLDAPFeature(),
+            charm_config=DOM1,
         )
-        result = step.is_skip(step_context)
-        assert result.result_type == ResultType.COMPLETED
 
-    def test_has_prompts(self):
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, self.charm_config
-        )
-        assert not step.has_prompts()
-
-    def test_update_domain(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, self.charm_config
-        )
+    @pytest.fixture(autouse=True)
+    def _reset(self, env):
+        env.jhelper.reset_mock(return_value=True, side_effect=True)
+
+    def test_update_domain(self, env, seeded_config_mocks, snap, step_context):
+        step = UpdateLDAPDomainStep(Mock(), env.jhelper, env.feature, env.charm_config)
         result = step.run(step_context)
-        step.tfhelper.write_tfvars.assert_called_with(
-            {
-                "ldap-channel": "2023.2/edge",
-                "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-            }
-        )
+        step.tfhelper.write_tfvars.assert_called_with(APPS_DOM1_CH)
         step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
         assert result.result_type == ResultType.COMPLETED
 
-    def test_update_wrong_domain(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, {"domain-name": "dom2"}
-        )
+    def test_update_wrong_domain(self, env, seeded_config_mocks, snap, step_context):
+        step = UpdateLDAPDomainStep(Mock(), env.jhelper, env.feature, DOM2)
         result = step.run(step_context)
         assert result.result_type == ResultType.FAILED
         assert result.message == "Domain not found"
 
-    def test_tf_apply_failed(self, read_config, update_config, snap, step_context):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, self.charm_config
-        )
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
-        result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
-        assert result.result_type == ResultType.FAILED
-        assert result.message == "apply failed..."
-
     def test_update_waiting_timed_out(
-        self, read_config, update_config, snap, step_context
+        self, env, seeded_config_mocks, snap, step_context
     ):
-        read_config.return_value = {
-            "ldap-channel": "2023.2/edge",
-            "ldap-apps": {"dom1": {"domain-name": "dom1"}},
-        }
-        step = UpdateLDAPDomainStep(
-            Mock(), self.jhelper, self.feature, self.charm_config
-        )
-        self.jhelper.wait_until_active.side_effect = TimeoutError("timed out")
-        step.tfhelper.apply.side_effect = TerraformException("apply failed...")
+        env.jhelper.wait_until_active.side_effect = TIMED_OUT
+        step = UpdateLDAPDomainStep(Mock(), env.jhelper, env.feature, env.charm_config)
         result = step.run(step_context)
-        step.tfhelper.apply.assert_called_once_with(reporter=step_context.reporter)
+        assert step.tfhelper.apply.called
         assert result.result_type == ResultType.FAILED
-        assert result.message == "apply failed..."
+        assert result.message == "timed out"
@@ -872,6 +872,35 @@ class TestUpdateOctaviaAmphoraConfigStepRun:
         assert result.result_type == ResultType.FAILED
 
 
+# ---------------------------------------------------------------------------
+# LoadbalancerFeature — terraform variables
+# ---------------------------------------------------------------------------
+
+
+class TestLoadbalancerFeatureSetTfvars:
+    def test_set_tfvars_on_enable_returns_tfvars(self):
+        feature = LoadbalancerFeature()
+        with patch.object(
+            feature,
+            "add_horizon_plugin_to_tfvars",
+            return_value={"horizon-plugins": ["octavia"]},
+        ):
+            tfvars = feature.set_tfvars_on_enable(Mock(), Mock())
+        assert tfvars["enable-octavia"] is True
+        assert tfvars["horizon-plugins"] == ["octavia"]
+
+    def test_set_tfvars_on_disable_returns_tfvars(self):
+        feature = LoadbalancerFeature()
+        with patch.object(
+            feature,
+            "remove_horizon_plugin_from_tfvars",
+            return_value={"horizon-plugins": []},
+        ):
+            tfvars = feature.set_tfvars_on_disable(Mock())
+        assert tfvars["enable-octavia"] is False
+        assert tfvars["horizon-plugins"] == []
+
+
 # ---------------------------------------------------------------------------
 # LoadbalancerFeature — requires property and enabled_commands
 # ---------------------------------------------------------------------------
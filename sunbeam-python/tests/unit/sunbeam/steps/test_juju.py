@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: 2023 - Canonical Ltd
 # SPDX-License-Identifier: Apache-2.0
 
+import dataclasses
+import json
 import subprocess
-import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-import pexpect
 import pytest
 
 import sunbeam.steps.juju as juju
@@ -26,63 +26,87 @@ def mock_open():
         yield p
 
 
+@pytest.fixture(scope="session")
+def shared_tmp_dir(tmp_path_factory):
+    """One temporary directory for the whole run instead of a file per test."""
+    return tmp_path_factory.mktemp("juju-steps")
+
+
+@pytest.fixture()
+def tmp_file(shared_tmp_dir, request) -> Path:
+    return shared_tmp_dir / f"{request.node.name}.tmp"
+
+
+@pytest.fixture(autouse=True)
+def patch_snap(snap, monkeypatch):
+    """Patch the Snap object once here instead of in every test."""
+    monkeypatch.setattr(juju, "Snap", lambda *args, **kwargs: snap)
+
+
 class TestWriteJujuStatusStep:
-    def test_is_skip(self, jhelper, step_context):
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteJujuStatusStep(jhelper, "openstack", tmpfile)
-            result = step.is_skip(step_context)
+    def test_is_skip(self, jhelper, tmp_file, step_context):
+        step = juju.WriteJujuStatusStep(jhelper, "openstack", tmp_file)
+        result = step.is_skip(step_context)
 
         assert result.result_type == ResultType.COMPLETED
 
-    def test_is_skip_when_model_not_present(self, jhelper, step_context):
+    def test_is_skip_when_model_not_present(self, jhelper, tmp_file, step_context):
         jhelper.model_exists.return_value = False
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteJujuStatusStep(jhelper, "openstack", tmpfile)
-            result = step.is_skip(step_context)
+        step = juju.WriteJujuStatusStep(jhelper, "openstack", tmp_file)
+        result = step.is_skip(step_context)
 
         assert result.result_type == ResultType.SKIPPED
 
-    def test_run(self, jhelper, step_context):
+    def test_run(self, jhelper, tmp_file, step_context):
         jhelper.get_model_status.return_value = {
             "applications": {"controller": {"status": "active"}}
         }
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteJujuStatusStep(jhelper, "openstack", Path(tmpfile.name))
-            result = step.run(step_context)
+        step = juju.WriteJujuStatusStep(jhelper, "openstack", tmp_file)
+        result = step.run(step_context)
 
         jhelper.get_model_status.assert_called_once()
         assert result.result_type == ResultType.COMPLETED
 
+    def test_run_serializes_status_dataclass(self, jhelper, tmp_file, step_context):
+        @dataclasses.dataclass
+        class FakeStatus:
+            apps: dict
+
+        jhelper.get_model_status.return_value = FakeStatus(
+            apps={"controller": {"status": "active"}}
+        )
+        step = juju.WriteJujuStatusStep(jhelper, "openstack", tmp_file)
+        result = step.run(step_context)
+        written = json.loads(tmp_file.read_text())
+
+        assert result.result_type == ResultType.COMPLETED
+        assert written == {"apps": {"controller": {"status": "active"}}}
+
 
 class TestWriteCharmLogStep:
-    def test_is_skip(self, jhelper, step_context):
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteCharmLogStep(jhelper, "openstack", tmpfile)
-            result = step.is_skip(step_context)
+    def test_is_skip(self, jhelper, tmp_file, step_context):
+        step = juju.WriteCharmLogStep(jhelper, "openstack", tmp_file)
+        result = step.is_skip(step_context)
 
         assert result.result_type == ResultType.COMPLETED
 
-    def test_is_skip_when_model_not_present(self, jhelper, step_context):
+    def test_is_skip_when_model_not_present(self, jhelper, tmp_file, step_context):
         jhelper.get_model.side_effect = ModelNotFoundException("not found")
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteCharmLogStep(jhelper, "openstack", tmpfile)
-            result = step.is_skip(step_context)
+        step = juju.WriteCharmLogStep(jhelper, "openstack", tmp_file)
+        result = step.is_skip(step_context)
 
         assert result.result_type == ResultType.SKIPPED
 
-    def test_run(self, mocker, jhelper, snap, check_call, mock_open, step_context):
-        mocker.patch.object(juju, "Snap", return_value=snap)
-        with tempfile.NamedTemporaryFile() as tmpfile:
-            step = juju.WriteCharmLogStep(jhelper, "openstack", Path(tmpfile.name))
-            step.model_uuid = "test-uuid"
-            result = step.run(step_context)
+    def test_run(self, jhelper, check_call, mock_open, tmp_file, step_context):
+        step = juju.WriteCharmLogStep(jhelper, "openstack", tmp_file)
+        step.model_uuid = "test-uuid"
+        result = step.run(step_context)
 
         assert result.result_type == ResultType.COMPLETED
 
 
 class TestJujuGrantModelAccessStep:
-    def test_run(self, mocker, snap, jhelper, run, step_context):
-        mocker.patch.object(juju, "Snap", return_value=snap)
+    def test_run(self, jhelper, run, step_context):
         jhelper.get_model_name_with_owner.return_value = "admin/control-plane"
         step = juju.JujuGrantModelAccessStep(jhelper, "fakeuser", "control-plane")
         result = step.run(step_context)
@@ -90,8 +114,7 @@ class TestJujuGrantModelAccessStep:
         jhelper.get_model_name_with_owner.assert_called_once()
         assert result.result_type == ResultType.COMPLETED
 
-    def test_run_model_not_exist(self, mocker, snap, jhelper, run, step_context):
-        mocker.patch.object(juju, "Snap", return_value=snap)
+    def test_run_model_not_exist(self, jhelper, run, step_context):
         jhelper.get_model_name_with_owner.side_effect = ModelNotFoundException(
             "Model 'missing' not found"
         )
@@ -108,84 +131,49 @@ class TestJujuLoginStep:
         step = juju.JujuLoginStep(None)
         assert step.is_skip(step_context).result_type == ResultType.SKIPPED
 
-    def test_run(self, step_context):
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
-            Mock(
-                return_value=Mock(
-                    __enter__=Mock(return_value=Mock(exitstatus=0)), __exit__=Mock()
-                )
-            ),
-        ):
-            step = juju.JujuLoginStep(Mock(user="test", password="test"))
-            step._get_juju_binary = Mock(return_value="juju")
-            assert step.is_skip(step_context).result_type == ResultType.COMPLETED
+    @pytest.fixture
+    def login_step(self):
+        step = juju.JujuLoginStep(Mock(user="test", password="test"))
+        step._get_juju_binary = Mock(return_value="juju")
+        return step
 
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
+    def test_run(self, mocker, login_step, step_context):
+        mocker.patch.object(
+            juju.pexpect,
+            "spawn",
             Mock(
                 return_value=Mock(
                     __enter__=Mock(return_value=Mock(exitstatus=0)),
                     __exit__=Mock(return_value=False),
                 )
             ),
-        ):
-            result = step.run(step_context)
-        assert result.result_type == ResultType.COMPLETED
+        )
+        assert login_step.is_skip(step_context).result_type == ResultType.COMPLETED
 
-    def test_run_pexpect_timeout(self, step_context):
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
-            Mock(
-                return_value=Mock(
-                    __enter__=Mock(return_value=Mock(exitstatus=0)), __exit__=Mock()
-                )
-            ),
-        ):
-            step = juju.JujuLoginStep(Mock(user="test", password="test"))
-            step._get_juju_binary = Mock(return_value="juju")
-            assert step.is_skip(step_context).result_type == ResultType.COMPLETED
+        mocker.patch.object(
+            juju.subprocess,
+            "run",
+            Mock(return_value=Mock(returncode=0, stdout="", stderr="")),
+        )
+        result = login_step.run(step_context)
+        assert result.result_type == ResultType.COMPLETED
 
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
-            Mock(
-                return_value=Mock(
-                    __enter__=Mock(
-                        return_value=Mock(
-                            exitstatus=0,
-                            expect=Mock(side_effect=pexpect.TIMEOUT("timeout")),
-                        )
-                    ),
-                    __exit__=Mock(return_value=False),
-                )
-            ),
-        ):
-            result = step.run(step_context)
+    def test_run_timeout(self, mocker, login_step, step_context):
+        mocker.patch.object(
+            juju.subprocess,
+            "run",
+            Mock(side_effect=subprocess.TimeoutExpired("juju", 60)),
+        )
+        result = login_step.run(step_context)
         assert result.result_type == ResultType.FAILED
 
-    def test_run_pexpect_failed_exitcode(self, step_context):
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
-            Mock(
-                return_value=Mock(
-                    __enter__=Mock(return_value=Mock(exitstatus=0)), __exit__=Mock()
-                )
-            ),
-        ):
-            step = juju.JujuLoginStep(Mock(user="test", password="test"))
-            step._get_juju_binary = Mock(return_value="juju")
-            assert step.is_skip(step_context).result_type == ResultType.COMPLETED
-
-        with patch(
-            "sunbeam.steps.juju.pexpect.spawn",
-            Mock(
-                return_value=Mock(
-                    __enter__=Mock(return_value=Mock(exitstatus=1)),
-                    __exit__=Mock(return_value=False),
-                )
-            ),
-        ):
-            result = step.run(step_context)
+    def test_run_failed_exitcode(self, mocker, login_step, step_context):
+        mocker.patch.object(
+            juju.subprocess,
+            "run",
+            Mock(return_value=Mock(returncode=1, stdout="", stderr="")),
+        )
+        result = login_step.run(step_context)
         assert result.result_type == ResultType.FAILED
 
 
@@ -786,8 +774,7 @@ class TestBoostrapJujuStep:
         result = step.is_skip(step_context)
         assert result.result_type == ResultType.SKIPPED
 
-    def test_run(self, mocker, snap, run, cclient, step_context):
-        mocker.patch.object(juju, "Snap", return_value=snap)
+    def test_run(self, run, cclient, step_context):
         step = juju.BootstrapJujuStep(
             cclient, "my-cloud", "my-cloud-type", "testcontroller"
         )
@@ -795,8 +782,7 @@ class TestBoostrapJujuStep:
         result = step.run(step_context)
         assert result.result_type == ResultType.COMPLETED
 
-    def test_run_when_boostrap_failed(self, mocker, snap, run, cclient, step_context):
-        mocker.patch.object(juju, "Snap", return_value=snap)
+    def test_run_when_boostrap_failed(self, run, cclient, step_context):
         run.side_effect = subprocess.CalledProcessError(
             cmd="juju bootstrap", returncode=1, output="Error output"
         )
@@ -92,8 +92,11 @@ class TestFeatureRegistration:
         call_args = mock_feature.check_gated.call_args
         assert call_args[1]["client"] is None
 
-        # Verify feature.register was called with enabled=False
-        mock_feature.register.assert_called_once_with(cli, {"enabled": False})
+        # Verify feature.register was called with enabled=False and the
+        # shared groups map computed once by the manager
+        mock_feature.register.assert_called_once_with(
+            cli, {"enabled": False}, groups={"init": cli}, skip_validation=False
+        )
 
 
 class TestListFeatureGates: